@@ -1,8 +1,10 @@
-"""contains functions used by both solvers and generators to animate the solving/generator algorithms
+"""contains functions used by both solvers and generators to animate the solving/generator algorithms,
+    the driver running their step generators, recording animations without a screen
     and also color constants for all pygame instances"""
 import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"  # remove pygame welcome msg
 import pygame
+import numpy as np
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -12,25 +14,56 @@ BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 INDIGO = (75, 0, 130)
 
+# events yielded by the step generators of the generators and solvers as (event, position).
+# position is a grid position (row, col), a flat cell index (int) or for CARVE also a (n, 2) numpy array of positions
+# or a slice of grid rows (every open position in those rows, only looked up when animating).
+# a step is one event or a tuple of events
+CARVE = 'carve'  # the position became part of the maze: a carved out cell or a removed wall
+ACTIVE = 'active'  # the position became part of the algorithm's active set (stack, frontier, random walk)
+INACTIVE = 'inactive'  # the position is no longer part of the active set/marked by any event (None: all positions)
+WALKER = 'walker'  # position of the extra random walker (Wilson's & Aldous Broder hybrid)
+VISIT = 'visit'  # the solver visited the cell
+VISIT_END = 'visit_end'  # the search from the end visited the cell (bidirectional search)
+PATH = 'path'  # the position is part of the found path
+
+# color positions get drawn in when marked by an event
+event_colors = {ACTIVE: RED, WALKER: INDIGO, VISIT: BLUE, VISIT_END: GREEN, PATH: INDIGO}
+
+
+# recording made by start_recording, None if not recording
+recording = None
+
+# (width, height) animation windows are limited to (see set_max_window_size), None for no limit
+max_window_size = None
+
+# every window used for animating: the colors of its tiles as last shown (shown) and as drawn for the next
+# update (frame), both as (rows, cols, 3) numpy arrays
+frames = dict()
+
 
 def animation_setup_grid(grid, tile_size=15):
-    """Function to setup a pygame screen for animating solver/generator algorithms
+    """Function to setup a pygame screen for animating solver/generator algorithms.
+    grids that don't fit in max_window_size get smaller tiles (can be less than a pixel) so the whole grid is shown
     args:
         grid (2d array): maze as grid used to set display dimensions according to it's size
         tile_size (int): size of tiles in animation
     returns:
-       clock(to manage fps) tile_size(to draw cells the appropriate size) win (pygame window) """
+       clock(to manage fps) tile_size(to draw cells the appropriate size, int or float) win (pygame window) """
     pygame.init()
     clock = pygame.time.Clock()
-    tile_size = tile_size
     cols = len(grid[0])
     rows = len(grid)
-    win = pygame.display.set_mode((cols * tile_size, rows * tile_size))
+    if max_window_size is not None and (cols * tile_size > max_window_size[0] or rows * tile_size > max_window_size[1]):
+        tile_size = min(max_window_size[0] / cols, max_window_size[1] / rows)
+    win = pygame.display.set_mode((max(round(cols * tile_size), 1), max(round(rows * tile_size), 1)))
+    # nothing of the new animation has been shown yet
+    frames.pop(win, None)
     return clock, tile_size, win
 
 
 def draw_grid(win, grid, tile_size, wall_color=BLACK, path_color=WHITE):
-    """Function to draw a grid containing 1's and 0's on a given pygame display
+    """Function to draw a grid containing 1's and 0's on a given pygame display.
+    the grid is mapped to tile colors with numpy, it is painted on the display by update_display
     args:
         win (pygame surface): pygame display
         grid (2d array): maze as grid containing 1's for walls/no edge and 0's for open cells
@@ -40,17 +73,73 @@ def draw_grid(win, grid, tile_size, wall_color=BLACK, path_color=WHITE):
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             pygame.quit()
-    cols = len(grid[0])
-    rows = len(grid)
+    frame = np.where(np.asarray(grid)[:, :, None] == 1, np.array(wall_color, dtype=np.uint8),
+                     np.array(path_color, dtype=np.uint8))
+    if win in frames:
+        frames[win]['frame'] = frame
+    else:
+        frames[win] = {'frame': frame, 'shown': None}
+
 
-    for r in range(rows):
-        for c in range(cols):
-            x = c * tile_size
-            y = r * tile_size
-            if grid[r][c] == 1:
-                pygame.draw.rect(win, wall_color, (x, y, tile_size, tile_size))
-            elif grid[r][c] == 0:
-                pygame.draw.rect(win, path_color, (x, y, tile_size, tile_size))
+def draw_cells(win, cells, color):
+    """Function to draw cells (tiles) of a grid drawn with draw_grid in a color, painted on the display by update_display
+    args:
+        win (pygame surface): pygame display
+        cells: grid positions as (row, col) (list of tuples or (n, 2) numpy array)
+        color (tuple): rgb color to draw the cells in"""
+    cells = np.asarray(cells, dtype=int).reshape(-1, 2)
+    frames[win]['frame'][cells[:, 0], cells[:, 1]] = color
+
+
+def update_display(win, tile_size, clock=None, fps=0, incremental=True, dirty=None):
+    """Function to paint everything drawn with draw_grid/draw_cells since the last update on the display and show it.
+    incremental only repaints the tiles that changed since the last update, otherwise (or on the first update)
+    the whole frame is blitted at once as a surface made from the tile colors (surfarray) scaled up by tile_size.
+    if the positions that were drawn on are given (dirty) only those are compared with the shown frame, which makes an
+    update cost as much as the drawn tiles instead of the whole frame
+    args:
+        win (pygame surface): pygame display
+        tile_size (int): size of tiles in animation
+        clock (pygame Clock): clock to limit the animation speed with
+        fps (int): animation speed
+        incremental (bool): only repaint changed tiles
+        dirty: grid positions drawn on since the last update as (n, 2) numpy array, None if unknown"""
+    frame, shown = frames[win]['frame'], frames[win]['shown']
+    if shown is None or shown.shape != frame.shape:
+        dirty = None
+    if dirty is not None:
+        dirty_rows, dirty_cols = dirty[:, 0], dirty[:, 1]
+    # when recording only the changes are stored, nothing is painted and the animation runs at full speed
+    if recording is not None:
+        recording.add_step(frame, dirty)
+        if dirty is None:
+            frames[win]['shown'] = frame.copy()
+        else:
+            shown[dirty_rows, dirty_cols] = frame[dirty_rows, dirty_cols]
+        return
+    changed = None
+    if incremental and dirty is not None:
+        changed = dirty[np.any(frame[dirty_rows, dirty_cols] != shown[dirty_rows, dirty_cols], axis=1)]
+    elif incremental and shown is not None and shown.shape == frame.shape:
+        changed = np.argwhere(np.any(frame != shown, axis=2))
+    # blitting the whole frame is faster than filling a lot of tiles one by one
+    if changed is None or len(changed) > frame.shape[0] * frame.shape[1] // 8:
+        surface = pygame.surfarray.make_surface(frame.transpose(1, 0, 2))
+        win.blit(pygame.transform.scale(surface, win.get_size()), (0, 0))
+        frames[win]['shown'] = frame.copy()
+    else:
+        for r, c in changed.tolist():
+            # tiles can be smaller than a pixel (see animation_setup_grid), they cover at least 1 pixel
+            left, top = int(c * tile_size), int(r * tile_size)
+            win.fill(frame[r, c].tolist(), (left, top, max(int((c + 1) * tile_size) - left, 1),
+                                            max(int((r + 1) * tile_size) - top, 1)))
+        if dirty is not None:
+            shown[dirty_rows, dirty_cols] = frame[dirty_rows, dirty_cols]
+        else:
+            frames[win]['shown'] = frame.copy()
+    if clock is not None:
+        clock.tick(fps)
+    pygame.display.flip()
 
 
 def draw_start_finish(win, tile_size, start, end):
@@ -60,5 +149,218 @@ def draw_start_finish(win, tile_size, start, end):
         tile_size(int): size of tiles in animation
         start(tuple): start position of the maze as (row, col)
         end(tuple): end/finish position of the maze as (row, col)"""
-    pygame.draw.rect(win, RED, (start[1] * tile_size, start[0] * tile_size, tile_size, tile_size))
-    pygame.draw.rect(win, YELLOW, (end[1] * tile_size, end[0] * tile_size, tile_size, tile_size))
+    draw_cells(win, [start], RED)
+    draw_cells(win, [end], YELLOW)
+
+
+def run_steps(steps, maze, animate=False, start_finish=None):
+    """Function to run a step generator of a generator/solver algorithm to the end.
+    without animation the steps are only taken, otherwise every step gets drawn (see animate_steps)
+    args:
+        steps (generator): step generator of the algorithm
+        maze (Maze): maze the algorithm runs on
+        animate: animate the algorithm, 0 (=False) or FPS as integer value.
+        start_finish (tuple): (start, end) grid positions to draw on top of every step (used for solvers)
+    returns:
+        the return value of the step generator (path for solvers)"""
+    if animate:
+        return animate_steps(steps, maze, animate, start_finish)
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
+
+
+def animate_steps(steps, maze, fps, start_finish=None):
+    """Function to animate a step generator, every step is drawn and shown with update_display.
+    the maze grid is drawn once, carve events change the drawn maze and the other events mark positions
+    in their color on top of it (event_colors) until an inactive event removes the mark
+    args:
+        steps (generator): step generator of the algorithm
+        maze (Maze): maze the algorithm runs on
+        fps (int): animation speed
+        start_finish (tuple): (start, end) grid positions to draw on top of every step
+    returns:
+        the return value of the step generator"""
+    clock, tile_size, win = animation_setup_grid(maze.grid)
+    draw_grid(win, maze.grid, tile_size)
+    frame = frames[win]['frame']
+    # colors of the maze without marks and the marked positions with their color
+    base = frame.copy()
+    marks = dict()
+    while True:
+        try:
+            step = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+        # positions drawn on in this step (single positions and arrays of positions) so only they get updated
+        dirty, dirty_arrays = [], []
+        for event, position in (step,) if step and isinstance(step[0], str) else step:
+            if isinstance(position, slice):
+                position = np.argwhere(np.asarray(maze.grid[position]) == 0) + (position.start, 0)
+            if isinstance(position, np.ndarray):
+                # carved out in bulk (vectorized algorithms), the marks stay on top
+                base[position[:, 0], position[:, 1]] = WHITE
+                frame[position[:, 0], position[:, 1]] = WHITE
+                for marked, color in marks.items():
+                    frame[marked] = color
+                dirty_arrays.append(position)
+                continue
+            if position is None:
+                for marked in marks:
+                    frame[marked] = base[marked]
+                dirty.extend(marks)
+                marks.clear()
+                continue
+            if not isinstance(position, tuple):
+                position = maze.cell_position(position)
+            if event == CARVE:
+                base[position] = WHITE
+                if position not in marks:
+                    frame[position] = WHITE
+            elif event == INACTIVE:
+                marks.pop(position, None)
+                frame[position] = base[position]
+            else:
+                marks[position] = event_colors[event]
+                frame[position] = event_colors[event]
+            dirty.append(position)
+        if start_finish is not None:
+            draw_start_finish(win, tile_size, *start_finish)
+            dirty.extend(start_finish)
+        dirty_arrays.append(np.array(dirty, dtype=int).reshape(-1, 2))
+        update_display(win, tile_size, clock, fps, dirty=np.concatenate(dirty_arrays))
+
+
+class Recording:
+    """Animation recorded without showing it: for every step (update_display call) the tiles that changed and their
+    new color. frames can be rendered from it afterwards as numpy arrays or PNG images.
+    Attributes:
+        shape (tuple): (rows, cols) of the recorded grid
+        palette (list): rgb colors used in the recording, tiles store the index of their color in this list
+        cells (list): numpy arrays with the flat tile index (row * cols + col) of the changed tiles per step
+        colors (list): numpy arrays with the palette index of the new color of the changed tiles per step
+    """
+
+    def __init__(self, shape=None, palette=None, cells=None, colors=None):
+        self.shape = shape
+        self.palette = palette if palette is not None else []
+        self.cells = cells if cells is not None else []
+        self.colors = colors if colors is not None else []
+        # colors of the tiles after the last step
+        self.last = None
+
+    def add_step(self, frame, dirty=None):
+        """stores the tiles of a frame that changed since the last step (all tiles for the first step)
+        Args:
+            frame: (rows, cols, 3) numpy array with the color of every tile
+            dirty: optional (n, 2) numpy array with the only positions that can have changed since the last step"""
+        if self.shape is None:
+            self.shape = frame.shape[:2]
+        elif self.shape != frame.shape[:2]:
+            raise ValueError(f'recording of a {self.shape} grid can not record a {frame.shape[:2]} grid')
+        frame = frame.reshape(-1, 3)
+        if self.last is None:
+            changed = np.arange(len(frame))
+        elif dirty is not None:
+            dirty = np.unique(dirty[:, 0] * self.shape[1] + dirty[:, 1])
+            changed = dirty[np.any(frame[dirty] != self.last[dirty], axis=1)]
+        else:
+            changed = np.flatnonzero(np.any(frame != self.last, axis=1))
+        colors, color_index = np.unique(frame[changed], axis=0, return_inverse=True)
+        for color in colors.tolist():
+            if tuple(color) not in self.palette:
+                self.palette.append(tuple(color))
+        to_palette = np.array([self.palette.index(tuple(color)) for color in colors.tolist()], dtype=np.uint8)
+        self.cells.append(changed.astype(np.uint32))
+        self.colors.append(to_palette[color_index.ravel()] if len(changed) else np.zeros(0, dtype=np.uint8))
+        if self.last is None or dirty is None:
+            self.last = frame.copy()
+        else:
+            self.last[changed] = frame[changed]
+
+    def frames(self, tile_size=1):
+        """renders the frames of the recording one by one
+        Args:
+            tile_size (int): size of tiles in pixels
+        Returns:
+            generator of (rows * tile_size, cols * tile_size, 3) numpy arrays (uint8)"""
+        palette = np.array(self.palette, dtype=np.uint8).reshape(-1, 3)
+        frame = np.zeros((self.shape[0] * self.shape[1], 3), dtype=np.uint8)
+        for cells, colors in zip(self.cells, self.colors):
+            frame[cells] = palette[colors]
+            yield np.repeat(np.repeat(frame.reshape(*self.shape, 3), tile_size, axis=0), tile_size, axis=1)
+
+    def frame_stack(self, tile_size=1):
+        """all frames of the recording
+        Args:
+            tile_size (int): size of tiles in pixels
+        Returns:
+            (steps, rows * tile_size, cols * tile_size, 3) numpy array (uint8)"""
+        return np.stack(list(self.frames(tile_size)))
+
+    def save_png(self, directory, tile_size=1):
+        """saves every frame of the recording as PNG image in a directory (frame_00000.png, frame_00001.png, ...)
+        Args:
+            directory: path of the directory
+            tile_size (int): size of tiles in pixels"""
+        os.makedirs(directory, exist_ok=True)
+        for i, frame in enumerate(self.frames(tile_size)):
+            pygame.image.save(pygame.surfarray.make_surface(frame.transpose(1, 0, 2)),
+                              os.path.join(directory, f'frame_{i:05d}.png'))
+
+    def save(self, path):
+        """saves the recording (event log) as a compressed numpy file
+        Args:
+            path: path of the file"""
+        np.savez_compressed(path, shape=np.array(self.shape), palette=np.array(self.palette, dtype=np.uint8),
+                            steps=np.cumsum([0] + [len(cells) for cells in self.cells]),
+                            cells=np.concatenate(self.cells) if self.cells else np.zeros(0, dtype=np.uint32),
+                            colors=np.concatenate(self.colors) if self.colors else np.zeros(0, dtype=np.uint8))
+
+    @classmethod
+    def load(cls, path):
+        """loads a recording saved with save
+        Args:
+            path: path of the file
+        Returns:
+            Recording object"""
+        with np.load(path) as file:
+            steps = file['steps']
+            return cls(tuple(file['shape'].tolist()), [tuple(color) for color in file['palette'].tolist()],
+                       np.split(file['cells'], steps[1:-1]), np.split(file['colors'], steps[1:-1]))
+
+
+def set_max_window_size(size):
+    """Function to limit the size of animation windows, larger mazes are animated with smaller tiles
+    args:
+        size (tuple): (width, height) in pixels, None for no limit"""
+    global max_window_size
+    max_window_size = size
+
+
+def start_recording():
+    """Function to start recording animations instead of showing them.
+    pygame uses the SDL dummy video driver so no screen is needed and the animations run at full speed.
+    returns:
+        Recording object the steps of the animations are stored in"""
+    global recording
+    if os.environ.get('SDL_VIDEODRIVER') != 'dummy':
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        # the display gets initialized again with the dummy driver on the next animation
+        pygame.display.quit()
+    recording = Recording()
+    return recording
+
+
+def stop_recording():
+    """Function to stop recording animations
+    returns:
+        the Recording object"""
+    global recording
+    stopped, recording = recording, None
+    return stopped
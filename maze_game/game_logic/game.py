@@ -1,9 +1,11 @@
-from maze_game.maze_logic.maze import Maze
-from maze_game.maze_logic.maze_solvers import depth_first_search
+from maze_game.maze_logic.maze import Maze, gen_steps
+from maze_game.maze_logic.chunked_maze import ChunkedMaze
+from maze_game.maze_logic.maze_solvers import solvers
 from maze_game.game_logic.menu import Menu
 from maze_game.game_logic.player import Player
 
 from pygame.locals import *
+import numpy as np
 import time
 from maze_game.animate_helpers import *
 
@@ -21,7 +23,17 @@ class Game:
             maze_difficulty (int): standard maze_difficulty
             tile_size (int): size of tiles in game, tiles will be squares ex: tile_size = 15 makes 15x15 tiles
             animate_fps (int): animation speed of solving and/or generating algorithms if 0 they won't be animated
+            solver (str): name of the solver (in maze_solvers.solvers) used to solve the maze when enter is pressed
             main_menu (Menu): Menu object serving as main menu
+            view_width (int): maximum width of the game window, wider mazes scroll with the player
+            view_height (int): maximum height of the game window, higher mazes scroll with the player
+            chunked_cells (int): mazes with more cells are generated in chunks while playing (ChunkedMaze),
+                                 solving is not available for those
+            chunk_size (int): number of cells on each axis of a chunk
+            maze (Maze): maze of the current game, its grid is used to look up walls for collisions
+            camera (pygame Rect): part of the maze (in pixels) that is shown in the window
+            maze_surface (pygame Surface): walls around the camera rendered once, copied to the screen when drawing
+            maze_rect (pygame Rect): part of the maze (in pixels) rendered on the maze_surface
         """
 
     def __init__(self):
@@ -43,6 +55,11 @@ class Game:
         self.maze_difficulty = 1
         self.tile_size = 15
         self.animate_fps = 200
+        self.solver = 'a_star'
+        self.view_width = 1200
+        self.view_height = 800
+        self.chunked_cells = 10 ** 6
+        self.chunk_size = 32
         self.main_menu = Menu(self)
 
     def event_loop(self):
@@ -81,21 +98,36 @@ class Game:
     def game_loop(self):
         """Game loop of the maze game.
         Initializes a new objects at the start of the function and enters the game_loop
-         checking for Collisions between the finish and player, key(events) and redrawing the whole scene each frame"""
+         checking for Collisions between the finish and player, key(events) and redrawing the player and finish each frame
+         on top of the walls that are rendered once at the start.
+         the window is the size of the maze up to view_width x view_height, the camera follows the player through
+         larger mazes and only the walls around it are rendered"""
         # new maze, player, finish, wall objects in game loop to create a new instance every game
-
-        maze = Maze(x=self.maze_w, y=self.maze_h, gen_func=self.maze_difficulty, animate=self.animate_fps)
+        # the generating and solving animations fit in the view size like the game window
+        set_max_window_size((self.view_width, self.view_height))
+        maze = self.generate_maze()
         self.player = Player(maze.start[1] * self.tile_size, maze.start[0] * self.tile_size, self.tile_size,
                              self.tile_size, RED)
         self.finish = Player(maze.end[1] * self.tile_size, maze.end[0] * self.tile_size, self.tile_size,
                              self.tile_size,
                              YELLOW)
-        self.walls = []
-        # setup screen resolution according to the maze size
-        ingame_display_width, ingame_display_height = maze.cols * self.tile_size, maze.rows * self.tile_size
+        # the maze grid is used to look up walls for collisions
+        self.maze = maze
+        # distances to the end are computed (and cached) once here so solving from anywhere is only following them
+        if not isinstance(maze, ChunkedMaze):
+            maze.distance_field
+        # setup screen resolution according to the maze size, at most the view size
+        ingame_display_width = min(maze.cols * self.tile_size, self.view_width)
+        ingame_display_height = min(maze.rows * self.tile_size, self.view_height)
         self.display = pygame.display.set_mode((ingame_display_width, ingame_display_height))
-        # add walls to the game object from the maze
-        self.add_walls(maze)
+        self.camera = pygame.Rect(0, 0, ingame_display_width, ingame_display_height)
+        # render the walls around the player and show them
+        self.maze_surface = None
+        self.follow_player()
+        self.draw_walls()
+        # position of the player on the screen when it was last drawn, the walls have to be redrawn there
+        self.last_player_rect = self.player.move(-self.camera.left, -self.camera.top)
+        pygame.display.flip()
 
         while self.in_game:
             # win condition if player has collision with finish
@@ -108,34 +140,68 @@ class Game:
                 self.in_game = False
                 self.main_menu.run_menu = True
 
-            # paths are white, walls will be drawn over white canvas making the paths white by default
-            self.display.fill(WHITE)
             # check events
             self.event_loop()
             # move player based on events in game object (self)
             self.player.move_player(self)
-            # re-draw everything
-            self.draw_all()
+            # re-draw the player and finish
+            dirty_rects = self.draw_all()
             # if key is enter solve the maze if key is ESC return to main menu
-            if self.K_ENTER:
-                self.solve(maze, self.player, depth_first_search)
+            if self.K_ENTER and not isinstance(maze, ChunkedMaze):
+                self.solve(maze, self.player, solvers[self.solver])
             if self.K_ESC:
                 self.in_game = False
             # tick the clock to run game at defined fps
             self.clock.tick(self.fps)
-            pygame.display.flip()
+            # only update the parts of the screen that changed
+            pygame.display.update(dirty_rects)
+
+    def generate_maze(self):
+        """generates the maze of a new game step by step: animated or at full speed,
+        handling the events every few thousand steps so the window keeps responding while generating big mazes.
+        mazes with more than chunked_cells cells are not generated up front but in chunks while playing
+            Returns:
+                Maze object (ChunkedMaze for large mazes)"""
+        if self.maze_w * self.maze_h > self.chunked_cells:
+            # whole chunks: the maze can be a bit larger than the chosen size
+            return ChunkedMaze(-(-self.maze_w // self.chunk_size), -(-self.maze_h // self.chunk_size),
+                               chunk_size=self.chunk_size, gen_func=self.maze_difficulty)
+        maze = Maze(x=self.maze_w, y=self.maze_h)
+        maze.gen_func = self.maze_difficulty
+        steps = gen_steps[self.maze_difficulty](maze)
+        if self.animate_fps:
+            run_steps(steps, maze, self.animate_fps)
+            return maze
+        for i, step in enumerate(steps):
+            if i % 4096 == 0:
+                self.event_loop()
+                # quit while generating
+                if not self.running:
+                    break
+        return maze
 
     def solve(self, maze, player, solver):
         """function to show the solution and also solve
-            the function will run a pathfinding algorithm and take over the player's controls to finish the game
+            the function will get the path to the finish and take over the player's controls to finish the game
             Args:
                 maze (Maze): Maze object containing a perfect maze
                 player (Player): player object
-                solver (Callable): solver function"""
-        # get path from current position to finish from a solver function
-        path_to_finish = solver(maze,
-                                start_pos=(int(player.y / self.tile_size), int(player.x / self.tile_size)),
-                                animate=self.animate_fps)
+                solver (Callable): solver function, shown searching the path when animating and the path isn't cached"""
+        start_pos = (int(player.y / self.tile_size), int(player.x / self.tile_size))
+        # the path comes from the solution cache, asking again from a cell on an earlier path doesn't search again.
+        # on a miss the distance field gives the path, or when animating the solver is shown searching for it
+        animated = []
+
+        def animated_solver(maze, start_pos):
+            animated.append(start_pos)
+            return solver(maze, start_pos=start_pos, animate=self.animate_fps)
+
+        path_to_finish = maze.solution(start_pos, animated_solver if self.animate_fps else None)
+        # the solver animation uses its own window, set the game window back and draw the walls again
+        if animated:
+            self.display = pygame.display.set_mode(self.camera.size)
+            self.draw_walls()
+            pygame.display.flip()
 
         # change velocity of player so the computer solving the maze doesn't look super slow
         player.velx = 3
@@ -169,9 +235,9 @@ class Game:
                     self.reset_keys()
 
                 self.event_loop()
-                self.draw_all()
+                dirty_rects = self.draw_all()
                 self.clock.tick(self.fps)
-                pygame.display.flip()
+                pygame.display.update(dirty_rects)
 
     def draw_text(self, text, size, x, y, color=WHITE):
         """Method to draw text over the screen
@@ -194,36 +260,63 @@ class Game:
         pygame.draw.rect(self.display, WHITE, text_rect)
         self.display.blit(text_surface, text_rect)
 
-    def add_walls(self, maze):
-        """Function to add walls from a maze object to the game as a Rectangle object (to handle collisions easily)
+    def follow_player(self):
+        """Function to move the camera so the player is in the middle of the screen (the camera stays inside the maze).
+        when the camera leaves the part of the maze that is rendered the walls around it get rendered again
+        Returns:
+            True if the camera moved"""
+        camera = self.camera.copy()
+        self.camera.center = self.player.center
+        self.camera.clamp_ip(pygame.Rect(0, 0, self.maze.cols * self.tile_size, self.maze.rows * self.tile_size))
+        if self.maze_surface is None or not self.maze_rect.contains(self.camera):
+            self.render_walls(self.maze)
+        return self.camera != camera
+
+    def render_walls(self, maze):
+        """Function to draw the walls around the camera from a maze object once on a surface (maze_surface).
+        the tiles within half a screen around the camera are looked up in the grid, mapped to colors with numpy and
+        scaled up by the tile size, so rendering costs the same for any size of maze. Every frame only this surface
+        has to be copied to the screen until the camera moves out of it
         Args:
             maze: Maze object containing a perfect maze"""
-        # iterate through the maze
-        for i in range(maze.rows):
-            for j in range(maze.cols):
-                # if current position at (i, j) is a wall, add wall to game's wall list with corrected position
-                # according to tile size
-                if maze.grid[i][j] == 1:
-                    y = i * self.tile_size
-                    x = j * self.tile_size
-                    self.walls.append(pygame.Rect(x, y, self.tile_size, self.tile_size))
-
-    def draw_walls(self):
-        """Function to draw walls on the screen"""
-        for wall in self.walls:
-            pygame.draw.rect(self.display, BLACK, wall)
+        area = self.camera.inflate(self.camera.width, self.camera.height)
+        first_row, first_col = max(area.top // self.tile_size, 0), max(area.left // self.tile_size, 0)
+        last_row = min((area.bottom - 1) // self.tile_size + 1, maze.rows)
+        last_col = min((area.right - 1) // self.tile_size + 1, maze.cols)
+        tiles = np.asarray(maze.grid[first_row:last_row, first_col:last_col])
+        # walls black, paths white
+        colors = np.where(tiles[:, :, None] == 1, np.array(BLACK, dtype=np.uint8), np.array(WHITE, dtype=np.uint8))
+        surface = pygame.surfarray.make_surface(colors.transpose(1, 0, 2))
+        self.maze_surface = pygame.transform.scale(surface, ((last_col - first_col) * self.tile_size,
+                                                             (last_row - first_row) * self.tile_size))
+        self.maze_rect = self.maze_surface.get_rect(topleft=(first_col * self.tile_size, first_row * self.tile_size))
+
+    def draw_walls(self, rect=None):
+        """Function to draw walls on the screen by copying the pre-rendered maze surface
+        Args:
+            rect: part of the screen to draw, None for the whole screen"""
+        offset = (self.maze_rect.left - self.camera.left, self.maze_rect.top - self.camera.top)
+        if rect is None:
+            self.display.blit(self.maze_surface, offset)
+        else:
+            self.display.blit(self.maze_surface, rect, rect.move(-offset[0], -offset[1]))
 
     def check_collision(self, player):
-        """Function to check for collisions between a given player and all the walls in the game
+        """Function to check for collisions between a given player and the walls in the game.
+        walls are tiles of the maze grid so only the tiles the player overlaps are looked up in the grid
         Args:
             player: player object to check for collisions
         Returns:
-            list with all walls that are in collision with player
+            list with all walls (as Rect) that are in collision with player
         """
         collisions = []
-        for wall in self.walls:
-            if player.colliderect(wall):
-                collisions.append(wall)
+        # grid rows and cols the player overlaps (right and bottom are just outside the player)
+        rows = range(max(player.top // self.tile_size, 0), min((player.bottom - 1) // self.tile_size + 1, self.maze.rows))
+        cols = range(max(player.left // self.tile_size, 0), min((player.right - 1) // self.tile_size + 1, self.maze.cols))
+        for i in rows:
+            for j in cols:
+                if self.maze.grid[i, j] == 1:
+                    collisions.append(pygame.Rect(j * self.tile_size, i * self.tile_size, self.tile_size, self.tile_size))
         return collisions
 
     def reset_keys(self):
@@ -231,7 +324,21 @@ class Game:
         self.K_LEFT, self.K_RIGHT, self.K_UP, self.K_DOWN, self.K_ENTER, self.K_ESC = False, False, False, False, False, False
 
     def draw_all(self):
-        """Function that calls all drawing functions to re-draw the entire scene with 1 function call"""
-        self.draw_walls()
-        self.player.draw(self.display)
-        self.finish.draw(self.display)
+        """Function that calls all drawing functions to re-draw the scene with 1 function call.
+        only the walls around the player (where it is and was last drawn) and the finish are redrawn,
+        unless the camera moved: then the whole screen is redrawn
+        Returns:
+            list with the rects of the screen that changed (to update the display with)"""
+        player = self.player.move(-self.camera.left, -self.camera.top)
+        if self.follow_player():
+            player = self.player.move(-self.camera.left, -self.camera.top)
+            self.draw_walls()
+            dirty_rects = [self.display.get_rect()]
+        else:
+            dirty_rects = [self.last_player_rect, player, self.finish.move(-self.camera.left, -self.camera.top)]
+            for rect in dirty_rects:
+                self.draw_walls(rect)
+        self.player.draw(self.display, self.camera.topleft)
+        self.finish.draw(self.display, self.camera.topleft)
+        self.last_player_rect = player
+        return dirty_rects
@@ -46,8 +46,9 @@ class Player(pygame.Rect):
             for col in game.check_collision(self):
                 self.left = col.right
 
-    def draw(self, win):
+    def draw(self, win, offset=(0, 0)):
         """draw player on the window
         Args:
-            win: pygame display object"""
-        pygame.draw.rect(win, self.color, (self.x, self.y, self.width, self.height))
\ No newline at end of file
+            win: pygame display object
+            offset: position in the maze of the top left corner of the window (camera)"""
+        pygame.draw.rect(win, self.color, (self.x - offset[0], self.y - offset[1], self.width, self.height))
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""Module to create mazes too large to generate up front: the maze is split up in chunks that are generated on demand"""
+
+from collections import OrderedDict
+import numpy as np
+
+from maze_game.maze_logic.maze import Maze
+
+
+class ChunkedGrid:
+    """grid of a ChunkedMaze, can be indexed like the grid of a Maze with a (row, col) position or with 2 slices
+    (returns a numpy array of that part of the grid). the chunks the index falls in get generated when needed"""
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.shape = (maze.rows, maze.cols)
+
+    def __getitem__(self, key):
+        row, col = key
+        if isinstance(row, slice) or isinstance(col, slice):
+            rows = row.indices(self.shape[0])[:2] if isinstance(row, slice) else (row, row + 1)
+            cols = col.indices(self.shape[1])[:2] if isinstance(col, slice) else (col, col + 1)
+            window = self.maze.window(rows[0], rows[1], cols[0], cols[1])
+            # an int index drops its axis like numpy does
+            return window[slice(None) if isinstance(row, slice) else 0, slice(None) if isinstance(col, slice) else 0]
+        return self.maze.value(row, col)
+
+
+class ChunkedMaze:
+    """ Maze made of square chunks that are only generated when a part of the maze is looked at.
+    Every chunk is a perfect maze generated from its own seed (derived from the seed of the maze and the chunk position)
+    and the chunks are joined by a binary tree over the chunks: every chunk opens one passage to the chunk north or
+    west of it (chunks in the top row always west, chunks in the left column always north), so the whole maze is a
+    perfect maze as well. the passage is also derived from the seed, so a chunk can be generated without its neighbors.
+    Only the last used chunks are kept in memory, chunks that are dropped are generated again when needed.
+
+    Attributes:
+        x (int): length of number of cells in cols
+        y (int): length of number of cells in rows
+        rows (int): total length of rows (cells & walls combined) == nr of cells in row (x) * 2 + 1.
+        cols (int): total length of cols
+        grid (ChunkedGrid): the grid of the maze, indexed like Maze.grid
+        start (tuple): position in the grid which is the starting position of the maze. always left upper corner
+        end (tuple): position in the grid which is the end/finish position of the maze. always right lower corner
+        chunk_size (int): number of cells on each axis of a chunk
+        chunks_x (int): number of chunks on x axis
+        chunks_y (int): number of chunks on y axis
+        gen_func (int): generation algorithm used to carve out the chunks (key in gen_funcs)
+        seed (int): seed of the maze
+        cache_size (int): number of generated chunks kept in memory
+    """
+
+    def __init__(self, chunks_x, chunks_y, chunk_size=32, gen_func=8, seed=None, cache_size=64):
+        """
+        creates a maze of chunks_x * chunks_y chunks without generating any of them
+        Args:
+            chunks_x (int): number of chunks on x axis
+            chunks_y (int): number of chunks on y axis
+            chunk_size (int): number of cells on each axis of a chunk
+            gen_func (int): which generation algorithm to use for the chunks
+            seed (int): seed of the maze, None for a random maze
+            cache_size (int): number of generated chunks kept in memory
+        """
+        self.chunk_size = chunk_size
+        self.chunks_x = chunks_x
+        self.chunks_y = chunks_y
+        self.x = chunks_x * chunk_size
+        self.y = chunks_y * chunk_size
+        self.rows = 2 * self.y + 1
+        self.cols = 2 * self.x + 1
+        self.start = (1, 1)
+        self.end = (self.rows - 2, self.cols - 2)
+        self.gen_func = gen_func
+        self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+        self.cache_size = cache_size
+        # generated chunks by (chunk_x, chunk_y), the least recently used chunk first
+        self._chunks = OrderedDict()
+        self.grid = ChunkedGrid(self)
+
+    def chunk_seeds(self, chunk_x, chunk_y):
+        """seeds of a chunk derived from the seed of the maze only
+        Args:
+            chunk_x (int): x position of the chunk
+            chunk_y (int): y position of the chunk
+        Returns:
+            seed of the chunk maze (int), seed of the passage to its neighbor (int)"""
+        return np.random.SeedSequence(self.seed, spawn_key=(chunk_x, chunk_y)).generate_state(2).tolist()
+
+    def passage(self, chunk_x, chunk_y):
+        """passage that connects a chunk to the chunk north or west of it
+        Args:
+            chunk_x (int): x position of the chunk
+            chunk_y (int): y position of the chunk
+        Returns:
+            (north, cell): north is True for a passage to the north (False: west), cell is the cell along that side
+            of the chunk the passage is next to. None for the first chunk"""
+        if chunk_x == 0 and chunk_y == 0:
+            return None
+        link_seed = self.chunk_seeds(chunk_x, chunk_y)[1]
+        north = chunk_x == 0 or (chunk_y != 0 and link_seed & 1 == 1)
+        return north, (link_seed >> 1) % self.chunk_size
+
+    def chunk(self, chunk_x, chunk_y):
+        """grid of a chunk including the walls around it (shared with the neighboring chunks),
+        generated if it isn't in memory
+        Args:
+            chunk_x (int): x position of the chunk
+            chunk_y (int): y position of the chunk
+        Returns:
+            (2 * chunk_size + 1) x (2 * chunk_size + 1) numpy array (uint8)"""
+        key = (chunk_x, chunk_y)
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+        grid = Maze(self.chunk_size, self.chunk_size, self.gen_func, seed=self.chunk_seeds(*key)[0]).grid
+        grid = np.asarray(grid).astype(np.uint8)
+        # this chunk opens its north or west side, the chunk below it can open its north side (the south side of this
+        # chunk) and the chunk right of it its west side (the east side of this chunk)
+        passage = self.passage(chunk_x, chunk_y)
+        if passage is not None:
+            north, cell = passage
+            if north:
+                grid[0, 2 * cell + 1] = 0
+            else:
+                grid[2 * cell + 1, 0] = 0
+        if chunk_y + 1 < self.chunks_y:
+            north, cell = self.passage(chunk_x, chunk_y + 1)
+            if north:
+                grid[-1, 2 * cell + 1] = 0
+        if chunk_x + 1 < self.chunks_x:
+            north, cell = self.passage(chunk_x + 1, chunk_y)
+            if not north:
+                grid[2 * cell + 1, -1] = 0
+        self._chunks[key] = grid
+        if len(self._chunks) > self.cache_size:
+            self._chunks.popitem(last=False)
+        return grid
+
+    def value(self, row, col):
+        """value of one position in the grid (1 wall, 0 open)
+        Args:
+            row (int): row in the grid
+            col (int): col in the grid
+        Returns:
+            0 or 1"""
+        span = 2 * self.chunk_size
+        # positions on the border between chunks are looked up in the chunk after it (both chunks store the border),
+        # the last border is only in the last chunk
+        chunk_y, chunk_x = min(row // span, self.chunks_y - 1), min(col // span, self.chunks_x - 1)
+        return int(self.chunk(chunk_x, chunk_y)[row - chunk_y * span, col - chunk_x * span])
+
+    def window(self, row_start, row_stop, col_start, col_stop):
+        """part of the grid, generating only the chunks it overlaps. positions outside the maze are walls
+        Args:
+            row_start (int): first row
+            row_stop (int): row after the last row
+            col_start (int): first col
+            col_stop (int): col after the last col
+        Returns:
+            (row_stop - row_start) x (col_stop - col_start) numpy array (uint8)"""
+        span = 2 * self.chunk_size
+        window = np.ones((max(row_stop - row_start, 0), max(col_stop - col_start, 0)), dtype=np.uint8)
+        for chunk_y in range(max(row_start, 0) // span, min((row_stop - 1) // span, self.chunks_y - 1) + 1):
+            for chunk_x in range(max(col_start, 0) // span, min((col_stop - 1) // span, self.chunks_x - 1) + 1):
+                # part of the chunk (with its borders) inside the window
+                top, left = chunk_y * span, chunk_x * span
+                r0, r1 = max(row_start, top), min(row_stop, top + span + 1)
+                c0, c1 = max(col_start, left), min(col_stop, left + span + 1)
+                window[r0 - row_start:r1 - row_start, c0 - col_start:c1 - col_start] = \
+                    self.chunk(chunk_x, chunk_y)[r0 - top:r1 - top, c0 - left:c1 - left]
+        return window
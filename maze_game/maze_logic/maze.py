@@ -1,13 +1,65 @@
 """Module to create a maze object"""
 
 import numpy as np
+import random
+import struct
+from collections import OrderedDict, deque
 from functools import partial
 
 from maze_game.maze_logic.maze_generators import *
+from maze_game.maze_logic.maze_tree import MazeTree
+
+# wall bits used in the packed wall representation of a maze (Maze.walls)
+NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
+
+# header of a maze file: file type, x, y, start (row, col), end (row, col), gen_func (0 == None).
+# followed by the east and south wall of every cell packed in 2 bits (4 cells per byte), see Maze.save
+MAZE_FILE_HEADER = struct.Struct('<4s7I')
+MAZE_FILE_TYPE = b'MAZE'
 
 # Easy: Depth First Search. Medium: Prim. Hard: Wilson & Aldous Broder hybrid (extension on Wilson)
+# vectorized (bulk generation): Binary tree, Sidewinder, Eller, Kruskal
 gen_funcs = {1: depth_first_search,
-             2: prim, 3: partial(wilson, extra_walker=True), 4: wilson, 5: aldous_broder}
+             2: prim, 3: partial(wilson, extra_walker=True), 4: wilson, 5: aldous_broder,
+             6: binary_tree, 7: sidewinder, 8: eller, 9: kruskal}
+# step generators of the generation algorithms (to generate a maze step by step, see run_steps)
+gen_steps = {1: depth_first_search_steps,
+             2: prim_steps, 3: partial(wilson_steps, extra_walker=True), 4: wilson_steps, 5: aldous_broder_steps,
+             6: binary_tree_steps, 7: sidewinder_steps, 8: eller_steps, 9: kruskal_steps}
+
+
+class Grid(np.ndarray):
+    """numpy array used as Maze.grid, calls on_write (if set) every time the array (or a view of it) is written to.
+    Used by the Maze to know when its cached wall representation is outdated.
+    The array is read only except for item assignment and fill, so writes that would skip on_write (in place
+    operators, ufuncs with out=, np.copyto, flat) raise a ValueError instead of leaving the caches outdated."""
+
+    def __array_finalize__(self, obj):
+        # only views and slices share the write callback of the array they are taken from,
+        # copies and results of operations (grid == 0, grid.copy()) have their own memory
+        on_write = getattr(obj, 'on_write', None)
+        self.on_write = on_write if on_write is not None and np.may_share_memory(self, obj) else None
+        # writeable plain view of the memory, set by the Maze for the grid itself (see Maze.grid)
+        self._data = None
+
+    def __setitem__(self, key, value):
+        if self._data is not None:
+            self._data[key] = value
+        elif self.flags.writeable:
+            super().__setitem__(key, value)
+        else:
+            # read only view of a maze grid, only writeable for this assignment
+            self.flags.writeable = True
+            try:
+                super().__setitem__(key, value)
+            finally:
+                self.flags.writeable = False
+        if self.on_write is not None:
+            self.on_write()
+
+    def fill(self, value):
+        """fills the array with value (as item assignment so on_write gets called)"""
+        self[...] = value
 
 
 class Maze:
@@ -17,12 +69,21 @@ class Maze:
         y (int): length of number of cells in rows
         rows (int): total length of rows (cells & walls combined) == nr of cells in row (x) * 2 + 1.
         cols (int): total length of cols
-        grid (2d numpy array): maze represented as grid starting as a full grid of 1's so the maze can be carved out.
+        grid (2d numpy array): maze represented as grid starting as a full grid of 1's so the maze can be carved out
+                               (uint8).
+        walls (1d numpy array): packed walls of every cell (see walls property), cached until the grid changes.
+        distance_field (tuple): distance to the end and next cell towards the end of every cell (see distance_field)
+        tree (MazeTree): tree index for path/distance queries between any 2 cells, built on first use
         start (tuple): position in the grid which is the starting position of the maze. always left upper corner
         end (tuple): position in the grid which is the end/finish position of the maze. always right lower corner
+        gen_func (int): generation algorithm used to carve out the maze (key in gen_funcs), None if not generated
+        seed (int): seed of the maze, None if the maze wasn't seeded
+        solution_cache_size (int): number of solutions (paths to the end) kept by solution, cleared when the grid changes
+        rng (random.Random): random number generator used by the generation algorithms
+        np_rng (numpy Generator): numpy random number generator (seeded from rng) used by the vectorized algorithms
     """
 
-    def __init__(self, x, y, gen_func=None, animate=False):
+    def __init__(self, x, y, gen_func=None, animate=False, seed=None, rng=None):
         """
         creates empty maze of size (y*2 + 1) * (x*2 +1)
         y, x representing the number of nodes/cells that will be placed on uneven rows/cols (0-visited 1-not-visited).
@@ -33,6 +94,8 @@ class Maze:
             y (int): number of cells(vertices) on y axis
             gen_func: which generation algorithm to use
         animate: animate the generating process, 0 (=False) or FPS as integer value.
+            seed (int): seed for the random number generator, the same seed, size and gen_func give the same maze
+            rng (random.Random): random number generator to use instead of creating one from the seed
 
         """
         # len nodes x and y axis
@@ -41,32 +104,470 @@ class Maze:
         # nodes including their possible edges (walls)
         self.rows = 2 * y + 1
         self.cols = 2 * x + 1
-        # make a grid for example  for x = 3 y = 3 a 7x7 2d array with 1's
-        self.grid = np.ones((self.rows, self.cols)).astype(int)
+        # the grid gets created on first use, for example for x = 3 y = 3 a 7x7 2d array with 1's.
+        # it is stored as uint8 (1 byte per grid position), the packed walls take 1 byte per cell
+        # a maze loaded from a file only has its packed walls until the grid is needed
+        self._grid = None
+        self._packed_walls = None
+        self.solution_cache_size = 16
+        # representations of the grid cached until it changes (see grid_changed)
+        self._walls = None
+        self._adj_lst = None
+        self._distance_field = None
+        # end the distance field was computed for, it's computed again when the end moves
+        self._distance_end = None
+        self._tree = None
+        # solutions by start cell, the least recently used first: (cells of the path, position of every cell in it)
+        self._solutions = OrderedDict()
+        self._solutions_end = None
+        # True if anything is cached, writes to the grid only have to reset the caches then
+        self._cached = False
         # start is at left up corner finish at right down
         self.start = (1, 1)
         self.end = (self.rows - 2, self.cols - 2)
+        self.gen_func = gen_func
+        self.seed = seed
+        # every random choice made for this maze comes from its own random number generator
+        self.rng = rng if rng is not None else random.Random(seed)
+        self._np_rng = None
         # carve out a maze with a given generation algorithm/function
         if gen_func:
             gen_funcs[gen_func](self, animate=animate)
 
+    @property
+    def np_rng(self):
+        """numpy random number generator for the vectorized generation algorithms, seeded from rng on first use"""
+        if self._np_rng is None:
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        return self._np_rng
+
+    @property
+    def grid(self):
+        """grid of the maze (Grid array, 0 == passage 1 == wall), created on first use from the packed walls of a
+        loaded maze or as a full grid of 1's"""
+        if self._grid is None:
+            if self._packed_walls is not None:
+                self.grid = self.unpack_grid(self._packed_walls)
+                self._packed_walls = None
+            else:
+                self.grid = np.ones((self.rows, self.cols), dtype=np.uint8)
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid):
+        """stores the grid as a uint8 Grid array so writes to it reset the cached representations
+        (other arrays of 0's and 1's get converted, read only arrays copied)"""
+        data = np.require(np.asarray(grid), dtype=np.uint8, requirements='W')
+        self._grid = data.view(Grid)
+        # the grid itself is written through a writeable view, every other write path is blocked (see Grid)
+        self._grid._data = data
+        self._grid.flags.writeable = False
+        self._grid.on_write = self.grid_changed
+        self.grid_changed()
+
+    def grid_changed(self):
+        """resets the cached walls, adjacent list, distance field, tree and solutions, gets called on every write to
+        the grid. while nothing is cached (generating the maze) a write only checks the _cached flag"""
+        if self._cached:
+            self._walls = None
+            self._adj_lst = None
+            self._distance_field = None
+            self._tree = None
+            self._solutions.clear()
+            self._cached = False
+
     @property
     def adj_lst(self):
-        """Generates a adjacent list from a maze in grid form
+        """Generates a adjacent list from a maze in grid form (cached until the grid changes)
         Returns:
             maze represented as adjacent list
          """
-        return {
-            (i, j):
-                [n for n in self.neighbors(i, j, radius=1)
-                 if self.grid[n] == 0] for i in range(self.rows) for j in range(self.cols) if self.grid[i, j] == 0}
+        if self._adj_lst is None:
+            self._adj_lst = {
+                (i, j):
+                    [n for n in self.neighbors(i, j, shuffle=False, radius=1)
+                     if self.grid[n] == 0] for i in range(self.rows) for j in range(self.cols) if self.grid[i, j] == 0}
+            self._cached = True
+        return self._adj_lst
+
+    @property
+    def walls(self):
+        """Packed representation of the maze: one uint8 per cell (flat index, see cell_index) in which the bits
+        NORTH, EAST, SOUTH and WEST are set if there is a wall between the cell and its neighbor in that direction.
+        Cells that are not carved out (1) have all 4 walls. Computed once and cached until the grid changes.
+        Returns:
+            1d numpy array (uint8) of length x * y
+        """
+        if self._walls is None and self._grid is None and self._packed_walls is not None:
+            self._walls = self.unpack_walls(self._packed_walls)
+            self._cached = True
+        if self._walls is None:
+            open_grid = self.grid == 0
+            cells = open_grid[1::2, 1::2]
+            # a passage between 2 cells is open if both cells and the wall position between them are open (0)
+            east = cells[:, :-1] & open_grid[1::2, 2:-1:2] & cells[:, 1:]
+            south = cells[:-1, :] & open_grid[2:-1:2, 1::2] & cells[1:, :]
+            walls = np.full((self.y, self.x), NORTH | EAST | SOUTH | WEST, dtype=np.uint8)
+            walls[:, :-1][east] ^= EAST
+            walls[:, 1:][east] ^= WEST
+            walls[:-1, :][south] ^= SOUTH
+            walls[1:, :][south] ^= NORTH
+            self._walls = walls.ravel()
+            self._cached = True
+        return self._walls
+
+    @property
+    def distance_field(self):
+        """distance of every cell to the end and the next cell on the way there, made with one breadth first search
+        from the end. in a perfect maze the path from any cell to the end is unique, so following the next cells from
+        any position gives the path to the end without searching. Computed once and cached until the grid
+        (or the end) changes.
+        Returns:
+            (dist, next_cell) 1d numpy arrays (int32) of length x * y over the flat cell indices:
+            dist is the number of steps from the cell to the end (0 for the end, -1 if the end can't be reached),
+            next_cell is the flat index of the next cell towards the end (the end for the end, -1 if unreachable)
+        """
+        if self._distance_field is None or self._distance_end != self.end:
+            end = self.cell_index(*self.end)
+            walls = self.walls.tobytes()
+            offsets = self.offsets
+            dist = [-1] * (self.x * self.y)
+            next_cell = [-1] * (self.x * self.y)
+            dist[end] = 0
+            next_cell[end] = end
+            queue = deque([end])
+            while queue:
+                current = queue.popleft()
+                for wall, offset in offsets:
+                    if not walls[current] & wall:
+                        cell = current + offset
+                        # every cell is reached from the cell after it on its way to the end
+                        if next_cell[cell] == -1:
+                            next_cell[cell] = current
+                            dist[cell] = dist[current] + 1
+                            queue.append(cell)
+            self._distance_field = (np.array(dist, dtype=np.int32), np.array(next_cell, dtype=np.int32))
+            self._distance_end = self.end
+            self._cached = True
+        return self._distance_field
+
+    @property
+    def tree(self):
+        """tree index of the maze (see MazeTree) to get paths and distances between any 2 cells without searching,
+        built from the distance field on first use and cached until the distance field changes"""
+        if self._tree is None or self._tree.depth is not self.distance_field[0]:
+            self._tree = MazeTree(self)
+            self._cached = True
+        return self._tree
+
+    def path_to_end(self, start_pos):
+        """path from a position to the end following the distance field, O(path length) once the field is computed
+        Args:
+            start_pos: position in the maze where the path starts (a cell or passage)
+        Returns:
+            the shortest path from start_pos to the end as a list of grid positions example: [(1,1),(2,1),...(5,5)]
+            None if the end can't be reached"""
+        dist, next_cell = self.distance_field
+        # from a passage the path goes through the cell next to it that is nearest to the end
+        cell = min(self.start_cells(*start_pos), key=lambda start: dist[start] if dist[start] != -1 else len(dist))
+        if dist[cell] == -1:
+            return None
+        cells = [cell]
+        for _ in range(dist[cell]):
+            cells.append(int(next_cell[cells[-1]]))
+        return self.cells_to_path(cells, start_pos)
+
+    def solution(self, start_pos, solver=None):
+        """path from a position to the end, cached by start cell. the cached paths are searched for the start cell
+        first: the rest of a path from any cell on it is the path from that cell, so asking again from a cell on a
+        path that was found before (like a player walking along the hint) doesn't need a new search.
+        Args:
+            start_pos: position in the maze where the path starts (a cell or passage)
+            solver: optional solver function (see solvers) to find the path when it isn't cached,
+                    by default the path follows the distance field
+        Returns:
+            the path from start_pos to the end as a list of grid positions example: [(1,1),(2,1),...(5,5)]
+            None if the end can't be reached"""
+        if self._solutions_end != self.end:
+            self._solutions.clear()
+            self._solutions_end = self.end
+        # a passage needs the paths of both cells next to it to know which way is shorter
+        start_cells = self.start_cells(*start_pos)
+        suffixes = []
+        for cell in start_cells:
+            for key, (cells, index) in self._solutions.items():
+                if cell in index:
+                    self._solutions.move_to_end(key)
+                    suffixes.append(cells[index[cell]:])
+                    break
+        if len(suffixes) == len(start_cells):
+            return self.cells_to_path(min(suffixes, key=len), start_pos)
+        if solver is None:
+            path = self.path_to_end(start_pos)
+        else:
+            path = solver(self, start_pos)
+        if path is None:
+            return None
+        # the cells of the path (without the passages), cached by the first cell
+        cells = [self.cell_index(*position) for position in path if position[0] % 2 == 1 and position[1] % 2 == 1]
+        self._solutions[cells[0]] = (cells, {path_cell: i for i, path_cell in enumerate(cells)})
+        if len(self._solutions) > self.solution_cache_size:
+            self._solutions.popitem(last=False)
+        self._cached = True
+        return path
+
+    def distances(self, sources, targets=None):
+        """distance map of the maze from one or more sources made with one breadth first search, to get the distances
+        to many targets (keys, checkpoints, coins) at once. the distances are in grid steps like the length of a path:
+        a cell d cells away from the nearest source gets 2d, a passage between cells d and d + 1 cells away 2d + 1.
+        Args:
+            sources: grid position (row, col) or list of grid positions to measure from (cells or passages)
+            targets: optional list of grid positions, the search stops as soon as all of them are reached,
+                     positions further away than the last target may be left at -1
+        Returns:
+            numpy array (int32) shaped like the grid with the distance to the nearest source of every position,
+            -1 for walls and for positions that can't be reached (or weren't reached before the search stopped)"""
+        if np.ndim(sources) == 1:
+            sources = [sources]
+        walls = self.walls.tobytes()
+        offsets = self.offsets
+        cells = self.x * self.y
+        dist = [-1] * cells
+        # sources on a cell start at 0 and sources on a passage at 1 on the cells next to it, the cells at 0 go in
+        # the queue first so it stays ordered by distance while every step adds 2
+        starts = ([], [])
+        for row, col in sources:
+            if self.grid[row, col] == 1:
+                raise ValueError(f"source {(row, col)} is a wall")
+            start_cells = self.start_cells(row, col)
+            starts[len(start_cells) - 1].extend(start_cells)
+        queue = deque()
+        for start_dist, start_cells in enumerate(starts):
+            for cell in start_cells:
+                if dist[cell] == -1:
+                    dist[cell] = start_dist
+                    queue.append(cell)
+        # a passage gets its distance from the nearest cell next to it which is the cell above/left of it
+        # (cell_index) or a cell that was reached before it, so reaching that cell is enough
+        target_cells = {self.cell_index(*target) for target in targets} if targets is not None else set()
+        is_target = bytearray(cells)
+        for cell in target_cells:
+            is_target[cell] = 1
+        # without targets remaining never gets to 0 and the search runs over the whole maze
+        remaining = sum(dist[cell] == -1 for cell in target_cells) if targets is not None else -1
+        while queue and remaining:
+            current = queue.popleft()
+            next_dist = dist[current] + 2
+            cell_walls = walls[current]
+            for wall, offset in offsets:
+                if not cell_walls & wall:
+                    cell = current + offset
+                    if dist[cell] == -1:
+                        dist[cell] = next_dist
+                        queue.append(cell)
+                        if is_target[cell]:
+                            remaining -= 1
+        # cells in the grid, then the open passages one step further than the nearest reached cell next to them
+        cell_dist = np.array(dist, dtype=np.int32).reshape(self.y, self.x)
+        grid = np.asarray(self.grid)
+        distances = np.full(grid.shape, -1, dtype=np.int32)
+        distances[1::2, 1::2] = cell_dist
+        for passages, first, second, open_passages in (
+                (distances[1::2, 2:-1:2], cell_dist[:, :-1], cell_dist[:, 1:], grid[1::2, 2:-1:2] == 0),
+                (distances[2:-1:2, 1::2], cell_dist[:-1], cell_dist[1:], grid[2:-1:2, 1::2] == 0)):
+            nearest = np.where(first == -1, second, np.where(second == -1, first, np.minimum(first, second)))
+            passages[:] = np.where(open_passages & (nearest != -1), nearest + 1, -1)
+        for row, col in sources:
+            distances[row, col] = 0
+        return distances
+
+    def is_perfect(self):
+        """checks if the maze is a perfect maze: all open positions of the grid (cells and passages) are connected and
+        there are no loops. runs without recursion: the open positions and the pairs of neighboring open
+        positions (edges) are counted with numpy in linear time, a tree has exactly one edge less than it has positions.
+        the positions are then joined along the edges with a vectorized union find (every round the roots of the edges
+        that aren't joined yet get hooked to the smallest root and all positions point to their root after pointer
+        jumping), with one edge less than positions the maze is a tree if everything is joined into one set.
+        every set takes part in a join each round so there are O(log n) rounds of at most O(n log n) pointer jumping:
+        O(n log² n) in the worst case for n open positions (a few seconds for a 2000x2000 maze).
+        Returns:
+            True if the maze is a perfect maze, False if it has loops or closed off areas"""
+        open_grid = np.asarray(self.grid) == 0
+        # the open positions numbered 0 ... number of open positions - 1
+        number = (np.cumsum(open_grid.ravel(), dtype=np.int32) - 1).reshape(open_grid.shape)
+        positions = np.count_nonzero(open_grid)
+        horizontal = open_grid[:, :-1] & open_grid[:, 1:]
+        vertical = open_grid[:-1, :] & open_grid[1:, :]
+        edges_from = np.concatenate((number[:, :-1][horizontal], number[:-1, :][vertical]))
+        edges_to = np.concatenate((number[:, 1:][horizontal], number[1:, :][vertical]))
+        if positions == 0 or len(edges_from) != positions - 1:
+            return False
+        parent = np.arange(positions, dtype=np.int32)
+        while True:
+            root_from, root_to = parent[edges_from], parent[edges_to]
+            # only the edges between different sets are left to join
+            apart = root_from != root_to
+            if not apart.any():
+                break
+            edges_from, edges_to, root_from, root_to = edges_from[apart], edges_to[apart], root_from[apart], root_to[apart]
+            np.minimum.at(parent, np.maximum(root_from, root_to), np.minimum(root_from, root_to))
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+        return bool(np.all(parent == parent[0]))
+
+    def pack_walls(self):
+        """packs the east and south wall of every cell in 2 bits (bit 0: east, bit 1: south), 4 cells per byte.
+        the north and west walls are the south and east walls of the neighboring cells and the outer walls are always
+        closed, so this is all that is needed to store a perfect maze (all cells carved out)
+        Returns:
+            1d numpy array (uint8) of length (x * y + 3) // 4"""
+        if self._grid is None and self._packed_walls is not None:
+            return np.asarray(self._packed_walls)
+        codes = (self.walls & EAST != 0) | (self.walls & SOUTH != 0) << 1
+        codes = np.concatenate((codes, np.zeros(-len(codes) % 4, dtype=codes.dtype))).reshape(-1, 4).astype(np.uint8)
+        return codes[:, 0] | codes[:, 1] << 2 | codes[:, 2] << 4 | codes[:, 3] << 6
+
+    def unpack_walls(self, packed):
+        """packed walls as made by pack_walls to the walls representation (see walls)
+        Args:
+            packed: 1d numpy array (uint8) made by pack_walls
+        Returns:
+            1d numpy array (uint8) of length x * y"""
+        codes = np.stack([packed >> shift & 3 for shift in (0, 2, 4, 6)], axis=1).ravel()[:self.x * self.y]
+        codes = codes.reshape(self.y, self.x)
+        # every step stays in uint8: bit 0 of a code is the east wall and bit 1 the south wall,
+        # shifted 1 to the left they are the EAST and SOUTH bits
+        walls = codes << 1
+        # north walls are the south walls of the row above, west walls the east walls of the col to the left
+        walls[1:, :] |= (codes[:-1, :] & 2) >> 1
+        walls[0, :] |= NORTH
+        walls[:, 1:] |= (codes[:, :-1] & 1) << 3
+        walls[:, 0] |= WEST
+        return walls.ravel()
+
+    def unpack_grid(self, packed):
+        """packed walls as made by pack_walls to a grid
+        Args:
+            packed: 1d numpy array (uint8) made by pack_walls
+        Returns:
+            grid (2d numpy array, uint8)"""
+        walls = self.unpack_walls(packed).reshape(self.y, self.x)
+        grid = np.ones((self.rows, self.cols), dtype=np.uint8)
+        grid[1::2, 1::2] = 0
+        grid[1::2, 2:-1:2][walls[:, :-1] & EAST == 0] = 0
+        grid[2:-1:2, 1::2][walls[:-1, :] & SOUTH == 0] = 0
+        return grid
+
+    def save(self, path):
+        """saves the maze to a file: a header with x, y, start, end and gen_func followed by the packed walls
+        (2 bits per cell, see pack_walls)
+        Args:
+            path: path of the file"""
+        with open(path, 'wb') as file:
+            file.write(MAZE_FILE_HEADER.pack(MAZE_FILE_TYPE, self.x, self.y, *self.start, *self.end, self.gen_func or 0))
+            file.write(self.pack_walls().tobytes())
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """loads a maze saved with save. with mmap the packed walls are memory mapped instead of read, the maze only
+        reads the parts of the file it uses and the grid is only created when it is needed (the solvers don't need it)
+        Args:
+            path: path of the file
+            mmap: memory map the file (True) or read it (False)
+        Returns:
+            Maze object"""
+        with open(path, 'rb') as file:
+            file_type, x, y, start_row, start_col, end_row, end_col, gen_func = \
+                MAZE_FILE_HEADER.unpack(file.read(MAZE_FILE_HEADER.size))
+        if file_type != MAZE_FILE_TYPE:
+            raise ValueError(f"'{path}' is not a maze file")
+        maze = cls(x, y)
+        maze.start = (start_row, start_col)
+        maze.end = (end_row, end_col)
+        maze.gen_func = gen_func or None
+        size = (x * y + 3) // 4
+        if mmap:
+            maze._packed_walls = np.memmap(path, dtype=np.uint8, mode='r', offset=MAZE_FILE_HEADER.size, shape=(size,))
+        else:
+            maze._packed_walls = np.fromfile(path, dtype=np.uint8, count=size, offset=MAZE_FILE_HEADER.size)
+        return maze
+
+    def cell_index(self, row_pos, col_pos):
+        """flat index of the cell at a grid position. cells are numbered row by row: 0 ... x * y - 1
+        a position between cells (wall/passage) gets the index of the cell above/left of it.
+        Args:
+            row_pos: row position in the grid
+            col_pos: col position in the grid
+        Returns:
+            flat index of the cell (int)"""
+        return (row_pos - 1) // 2 * self.x + (col_pos - 1) // 2
+
+    def start_cells(self, row_pos, col_pos):
+        """cells a search from a grid position starts from: the cell itself or both cells next to a passage
+        (the player can stand between 2 cells), which are both 1 step away from the passage
+        Args:
+            row_pos: row position in the grid
+            col_pos: col position in the grid
+        Returns:
+            list of flat indices of the cells"""
+        if row_pos % 2 == 1 and col_pos % 2 == 1:
+            return [self.cell_index(row_pos, col_pos)]
+        if row_pos % 2 == 1:
+            return [self.cell_index(row_pos, col_pos - 1), self.cell_index(row_pos, col_pos + 1)]
+        return [self.cell_index(row_pos - 1, col_pos), self.cell_index(row_pos + 1, col_pos)]
+
+    def cell_position(self, index):
+        """grid position of a cell from its flat index
+        Args:
+            index: flat index of the cell
+        Returns:
+            position in the grid as (row, col)"""
+        return index // self.x * 2 + 1, index % self.x * 2 + 1
+
+    @property
+    def offsets(self):
+        """(wall bit, offset) pair for every direction. adding the offset to a flat cell index gives the index of the
+        neighboring cell in that direction, the wall bit tells if that neighbor can be reached (see walls)"""
+        return (NORTH, -self.x), (EAST, 1), (SOUTH, self.x), (WEST, -1)
+
+    def connected_cells(self, index):
+        """function to get the cells that can be reached from a cell in one step (no wall in between)
+        Args:
+            index: flat index of the cell
+        Returns:
+            list of flat indices of the connected cells"""
+        walls = self.walls[index]
+        return [index + offset for wall, offset in self.offsets if not walls & wall]
+
+    def cells_to_path(self, cells, start_pos=None):
+        """converts a path of connected cells to a path of grid positions including the passages between the cells
+        Args:
+            cells: list of flat cell indices ordered from start to end
+            start_pos: optional grid position the path starts from, if it is a passage instead of a cell
+                       (the player can stand between 2 cells) the path gets corrected to start from that passage
+        Returns:
+            path as a list of grid positions example: [(1,1),(2,1),(3,1)]"""
+        path = []
+        for i, index in enumerate(cells):
+            position = self.cell_position(index)
+            if i:
+                path.append(((path[-1][0] + position[0]) // 2, (path[-1][1] + position[1]) // 2))
+            path.append(position)
+        if start_pos is not None and path[0] != start_pos:
+            # cell_index maps a passage to the cell above/left of it. if the path walks back through the passage
+            # skip that cell otherwise step from the passage into that cell
+            path = path[1:] if len(path) > 1 and path[1] == start_pos else [start_pos] + path
+        return path
 
     def destroy_wall(self, current_cell, neighbor_cell):
         """function to destroy a wall between 2 given cells
         Args:
             current_cell(tuple): cell position (row, col)
             neighbor_cell(tuple): neighboring cell position (row, col) """
-        self.grid[(current_cell[0] + neighbor_cell[0]) // 2][(current_cell[1] + neighbor_cell[1]) // 2] = 0
+        self.grid[(current_cell[0] + neighbor_cell[0]) // 2, (current_cell[1] + neighbor_cell[1]) // 2] = 0
 
     def neighbors(self, row_pos, col_pos, shuffle=True, radius=2):
         """ function to get the neighbors of a certain position in the grid.
@@ -86,5 +587,5 @@ class Maze:
              *[(row_pos, col_pos + i) for i in range(-radius, radius + 1, radius * 2) if
                0 < col_pos + i < self.cols - 1]]
         if shuffle:
-            random.shuffle(neighbors_lst)
+            self.rng.shuffle(neighbors_lst)
         return neighbors_lst
@@ -0,0 +1,86 @@
+"""Module to generate many mazes at once spread across a pool of processes"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+
+from maze_game.maze_logic.maze import Maze
+
+
+def maze_seed(seed, i):
+    """seed of the i-th maze in a batch, derived from the seed of the batch only so the maze doesn't depend on
+    which worker generates it
+    Args:
+        seed (int): seed of the batch
+        i (int): number of the maze in the batch
+    Returns:
+        seed of the maze (int)"""
+    return int(np.random.SeedSequence(seed, spawn_key=(i,)).generate_state(1)[0])
+
+
+def pack_maze(maze):
+    """packs the grid of a maze into bytes (1 bit per grid position) to send it between processes
+    Args:
+        maze: Maze object
+    Returns:
+        packed grid (bytes)"""
+    return np.packbits(maze.grid == 1).tobytes()
+
+
+def unpack_maze(packed, x, y, gen_func=None, seed=None):
+    """creates a maze object from a grid packed by pack_maze
+    Args:
+        packed (bytes): packed grid
+        x (int): number of cells on x axis of the packed maze
+        y (int): number of cells on y axis of the packed maze
+        gen_func (int): generation algorithm the packed maze was made with (key in gen_funcs)
+        seed (int): seed the packed maze was made with
+    Returns:
+        Maze object"""
+    maze = Maze(x, y, seed=seed)
+    # set after creating the maze, passing gen_func to Maze would carve out a new maze
+    maze.gen_func = gen_func
+    maze.grid = np.unpackbits(np.frombuffer(packed, dtype=np.uint8),
+                              count=maze.rows * maze.cols).reshape(maze.rows, maze.cols)
+    return maze
+
+
+def generate_packed(x, y, gen_func, seeds):
+    """generates a maze for every seed (runs in the worker processes)
+    Args:
+        x (int): number of cells on x axis
+        y (int): number of cells on y axis
+        gen_func (int): which generation algorithm to use (key in gen_funcs)
+        seeds (list): seed of every maze to generate
+    Returns:
+        list of packed grids (bytes)"""
+    return [pack_maze(Maze(x, y, gen_func, seed=seed)) for seed in seeds]
+
+
+def generate_batch(n, x, y, gen_func, seed=None, workers=None):
+    """generates n mazes of the same size spread across a pool of worker processes.
+    every maze gets its own seed derived from the batch seed, so the same seed always gives the same mazes
+    no matter how many workers are used. the workers send the grids back packed to 1 bit per grid position.
+    Args:
+        n (int): number of mazes
+        x (int): number of cells on x axis
+        y (int): number of cells on y axis
+        gen_func (int): which generation algorithm to use (key in gen_funcs)
+        seed (int): seed of the batch, None for a random batch
+        workers (int): number of worker processes, None for the number of processors, 1 to generate in this process
+    Returns:
+        list of n Maze objects"""
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    seeds = [maze_seed(seed, i) for i in range(n)]
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        packed = generate_packed(x, y, gen_func, seeds)
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            # a few chunks of seeds per worker to keep the number of tasks (and messages) low
+            chunk_size = max(1, n // (workers * 4))
+            chunks = [seeds[i:i + chunk_size] for i in range(0, n, chunk_size)]
+            packed = [grid for chunk in executor.map(generate_packed, [x] * len(chunks), [y] * len(chunks),
+                                                     [gen_func] * len(chunks), chunks) for grid in chunk]
+    return [unpack_maze(grid, x, y, gen_func, seeds[i]) for i, grid in enumerate(packed)]
@@ -1,9 +1,20 @@
 """Module containing different algorithms to generate mazes"""
 
-import random
+import itertools
+import numpy as np
 from maze_game.animate_helpers import *
 
 
+def wall_between(current_cell, neighbor_cell):
+    """grid position of the wall between 2 neighboring cells
+    Args:
+        current_cell(tuple): cell position (row, col)
+        neighbor_cell(tuple): neighboring cell position (row, col)
+    Returns:
+        position of the wall as (row, col)"""
+    return (current_cell[0] + neighbor_cell[0]) // 2, (current_cell[1] + neighbor_cell[1]) // 2
+
+
 def random_walker(maze, current_cell, path=[]):
     """random walker used in Aldolous Broder and Wilson's algorithm if chosen to use a extra walker.
     randomly walks (once per function calL) along any cells of the maze. If the cell hasn't been visited yet the passages gets carved out.
@@ -30,6 +41,126 @@ def random_walker(maze, current_cell, path=[]):
     return next_cell
 
 
+GROWING_TREE_POLICIES = ('newest', 'random', 'oldest', 'mixed')
+
+
+def growing_tree(maze, policy='newest', split=0.5, animate=False):
+    """
+    Time Complexity:
+        O(N) Vertices.
+
+    Space Complexity:
+        O(N) Vertices.
+
+    The algorithm:
+        Picks a random starting cell, marks it as part of the maze and adds it to a list of active cells.
+        a cell is picked from the active cells by the policy, if it has not visited neighbors a passage is carved out
+        to a random one of them which gets added to the active cells, otherwise the picked cell is removed.
+        Repeat until no cells are active and the algorithm is finished.
+        the policy decides what kind of maze it becomes:
+            newest: the last added cell, same as depth_first_search (long winding corridors)
+            random: a random cell, same as the simplified prim (many short dead ends)
+            oldest: the first added cell (long straight corridors from the start)
+            mixed: the newest cell with a chance of split, else a random cell
+
+    The active cells are kept in a list in the order they were added where every policy picks and removes in O(1):
+    the newest cell is popped from the end, the oldest cell is removed by moving the index of the head of the list
+    and a random cell is swapped with the last cell before it's popped. the mixed policy also picks the newest cell
+    so a random cell is marked as removed instead (keeping the order), removed cells are skipped when picking and
+    dropped from the list once they are half of it.
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        policy: how the next cell is picked from the active cells, one of GROWING_TREE_POLICIES
+        split: chance to pick the newest cell for the mixed policy
+        animate: animate the generating process, 0 (=False) or FPS as integer value.
+    """
+    run_steps(growing_tree_steps(maze, policy, split), maze, animate)
+
+
+def growing_tree_steps(maze, policy='newest', split=0.5):
+    """step generator of growing_tree
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        policy: how the next cell is picked from the active cells, one of GROWING_TREE_POLICIES
+        split: chance to pick the newest cell for the mixed policy
+    Yields:
+        a step per carved out cell (carved cell and wall, the cell becoming active) and per cell leaving the active cells
+    """
+    if policy not in GROWING_TREE_POLICIES:
+        raise ValueError(f"unknown growing tree policy '{policy}', choose from {GROWING_TREE_POLICIES}")
+    return _growing_tree_steps(maze, policy, split)
+
+
+def _growing_tree_steps(maze, policy, split):
+    """the generator of growing_tree_steps (separate so a wrong policy raises when the steps are created)"""
+    x, cells, rng, grid = maze.x, maze.x * maze.y, maze.rng, maze.grid
+    newest, oldest, mixed = policy == 'newest', policy == 'oldest', policy == 'mixed'
+    # cells are flat indices (see Maze.cell_index), visited cells are part of the maze
+    visited = bytearray(cells)
+    start = rng.randrange(cells)
+    visited[start] = 1
+    start_pos = maze.cell_position(start)
+    grid[start_pos] = 0
+    yield (CARVE, start_pos), (ACTIVE, start_pos)
+    # the active cells are active[head:] in the order they were added, removed cells (mixed policy) are -1
+    active = [start]
+    head = 0
+    removed = 0
+    while head < len(active):
+        if newest or mixed and rng.random() < split:
+            index = len(active) - 1
+        elif oldest:
+            index = head
+        else:
+            index = rng.randrange(head, len(active))
+            while active[index] < 0:
+                index = rng.randrange(head, len(active))
+        current = active[index]
+        col = current % x
+        # not visited neighbors in the order north, east, south, west
+        neighbors = []
+        if current >= x and not visited[current - x]:
+            neighbors.append(current - x)
+        if col != x - 1 and not visited[current + 1]:
+            neighbors.append(current + 1)
+        if current + x < cells and not visited[current + x]:
+            neighbors.append(current + x)
+        if col != 0 and not visited[current - 1]:
+            neighbors.append(current - 1)
+        if neighbors:
+            # carve out a passage to a random not visited neighbor and make it active
+            next_cell = neighbors[rng.randrange(len(neighbors))] if len(neighbors) > 1 else neighbors[0]
+            visited[next_cell] = 1
+            active.append(next_cell)
+            current_pos, next_pos = maze.cell_position(current), maze.cell_position(next_cell)
+            wall = wall_between(current_pos, next_pos)
+            grid[wall] = 0
+            grid[next_pos] = 0
+            yield (CARVE, wall), (CARVE, next_pos), (ACTIVE, next_pos)
+        else:
+            # remove the cell from the active cells in O(1)
+            if index == len(active) - 1:
+                active.pop()
+                # the newest cell has to be an active cell again
+                while len(active) > head and active[-1] < 0:
+                    active.pop()
+                    removed -= 1
+            elif index == head:
+                head += 1
+            elif not mixed:
+                # only random picks, the order of the active cells doesn't matter
+                active[index] = active.pop()
+            else:
+                active[index] = -1
+                removed += 1
+                # drop the removed cells when they are half of the list so random picks take 2 tries on average
+                if 2 * removed > len(active) - head:
+                    active = [cell for cell in active[head:] if cell >= 0]
+                    head = 0
+                    removed = 0
+            yield INACTIVE, maze.cell_position(current)
+
+
 def depth_first_search(maze, animate=False):
     """
     Author:
@@ -49,47 +180,23 @@ def depth_first_search(maze, animate=False):
         if ran into a dead-end return to the most previously visited position that still has not visited neighbors
         if no cells have not visited neighbors anymore the algorithm is finished
 
-    Iterative over recursive implementation to be more memory efficient and avoid stack overflow.
+    Iterative over recursive implementation to be more memory efficient and avoid stack overflow
+    (growing_tree with the newest policy).
     Args:
         maze: maze object which will be used to store the generated maze.
         animate: animate the generating process, 0 (=False) or FPS as integer value.
     """
+    run_steps(depth_first_search_steps(maze), maze, animate)
 
-    def draw():
-        """Custom draw function"""
-        draw_grid(win, maze.grid, tile_size)
-        for position in stack:
-            pygame.draw.rect(win, RED, (position[1] * tile_size, position[0] * tile_size, tile_size, tile_size))
-        clock.tick(animate)
-        pygame.display.flip()
-
-    if animate:
-        clock, tile_size, win = animation_setup_grid(maze.grid)
-    # start at the start position and mark that cell as part of the maze / visited (0)
-    start = (random.randrange(1, maze.rows, 2), random.randrange(1, maze.rows, 2))
-
-    stack = [start]
-    maze.grid[start] = 0
-    # while the stack has elements in it (== not all cells have been visited)
-    while stack:
-        # current cell is most recent cell in the stack
-        current_cell = stack[-1]
-        # get all not visited neighbors from the current cell (if the value in the grid is 1 the cell is not visited)
-        neighbors = [n for n in maze.neighbors(current_cell[0], current_cell[1], shuffle=True) if maze.grid[n] == 1]
-        # if no not visited neighbors: pop from stack
-        if len(neighbors) == 0:
-            stack = stack[:-1]
-        # else make a random neighbor the next cell destroy the wall between the current and next cell,
-        # and mark it as part of the maze (0) and add to stack
-        else:
-            next_cell = neighbors[0]
-            maze.grid[next_cell] = 0
-            stack.append(next_cell)
-            # destroy wall between current cell and next cell
-            maze.destroy_wall(current_cell, next_cell)
 
-        if animate:
-            draw()
+def depth_first_search_steps(maze):
+    """step generator of depth_first_search: the growing tree algorithm that always picks the newest cell (a stack)
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a step per carved out cell (carved cell and wall, cell pushed on the stack) and per backtrack (cell popped)
+    """
+    return growing_tree_steps(maze, 'newest')
 
 
 def aldous_broder(maze, animate=False):
@@ -114,31 +221,33 @@ def aldous_broder(maze, animate=False):
         maze: maze object which will be used to store the generated maze.
         animate: animate the generating process, 0 (=False) or FPS as integer value.
     """
+    run_steps(aldous_broder_steps(maze), maze, animate)
 
-    def draw():
-        """Custom draw function"""
-        draw_grid(win, maze.grid, tile_size)
-        pygame.draw.rect(win, RED,
-                         (current_cell[1] * tile_size, current_cell[0] * tile_size, tile_size, tile_size))
-        pygame.display.flip()
-        clock.tick(animate)
-
-    if animate:
-        clock, tile_size, win = animation_setup_grid(maze.grid)
 
+def aldous_broder_steps(maze):
+    """step generator of aldous_broder
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a step per random step (the walker moving to the next cell, carving it and the wall if not visited before)
+    """
     # start a a random position and mark that cell as part of the maze / visited (0)
-    current_cell = (random.randrange(1, maze.rows, 2), random.randrange(1, maze.rows, 2))
+    current_cell = (maze.rng.randrange(1, maze.rows, 2), maze.rng.randrange(1, maze.cols, 2))
     maze.grid[current_cell] = 0
+    yield (CARVE, current_cell), (ACTIVE, current_cell)
 
     visited = {current_cell: True}
     # while the maze contains not visited cells
     while len(visited) < maze.x * maze.y:
         # perform a random step (destroys walls and next cell if the step steps on a cell that hasn't been visited
-        current_cell = random_walker(maze, current_cell)
-        if visited.get(current_cell) is None:
-            visited[current_cell] = True
-        if animate:
-            draw()
+        next_cell = random_walker(maze, current_cell)
+        if visited.get(next_cell) is None:
+            visited[next_cell] = True
+            yield (INACTIVE, current_cell), (CARVE, wall_between(current_cell, next_cell)), (CARVE, next_cell), \
+                (ACTIVE, next_cell)
+        else:
+            yield (INACTIVE, current_cell), (ACTIVE, next_cell)
+        current_cell = next_cell
 
 
 def prim(maze, animate=False):
@@ -156,52 +265,27 @@ def prim(maze, animate=False):
         (2, Difficulty: Medium)
 
     The algorithm:
-        Picks a random starting cell mark it at part of the maze and add all not visited neighbors to a frontier set.
-        pick a random cell from the frontier set and connect it to a cell that is already part of the maze.
-        mark the random cell as part of the maze and add all not visited neighbors to the frontier.
-        Repeat until frontier is empty and the algorithm is finished
+        Picks a random starting cell mark it at part of the maze and make it active.
+        pick a random active cell and connect it to a random not visited neighbor, which becomes part of the maze and
+        active as well. if the picked cell has no not visited neighbors it stops being active.
+        Repeat until no cells are active and the algorithm is finished
+        (the simplified version of Prim's algorithm: growing_tree with the random policy)
 
     Args:
         maze: maze object which will be used to store the generated maze.
         animate: animate the generating process, 0 (=False) or FPS as integer value."""
+    run_steps(prim_steps(maze), maze, animate)
+
+
+def prim_steps(maze):
+    """step generator of prim: the growing tree algorithm that picks a random active cell
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a step per carved out cell (carved cell and wall, the cell becoming active) and per cell leaving the active cells
+    """
+    return growing_tree_steps(maze, 'random')
 
-    def draw():
-        """Custom draw function"""
-        draw_grid(win, maze.grid, tile_size)
-        for position in frontier:
-            pygame.draw.rect(win, RED, (position[1] * tile_size, position[0] * tile_size, tile_size, tile_size))
-        pygame.display.flip()
-        clock.tick(animate)
-
-    if animate:
-        clock, tile_size, win = animation_setup_grid(maze.grid)
-    # set of all cells that are neighbors of cells that have been visited but not visited themself.
-    frontier = set()
-    start = (random.randrange(1, maze.rows, 2), random.randrange(1, maze.rows, 2))
-
-    # start at the start position and mark that cell as part of the maze / visited (0)
-    maze.grid[start] = 0
-    # add the neighbors of the starting cell to the frontier
-    for cell in maze.neighbors(start[0], start[1]):
-        frontier.add(cell)
-    # algorithm finishes when frontier is empty: all cells have been visited.
-    while frontier:
-        # choose a random next cell from the frontier
-        random_frontier_cell = random.sample(frontier, 1)[0]
-        # get a cell that is already in the maze and is also a neighbor of the frontier cell
-        connected_cell = [n for n in maze.neighbors(random_frontier_cell[0], random_frontier_cell[1]) if
-                          maze.grid[n] == 0]
-        # destroy wall between current cell and next cell and mark the random frontier cell as part of the maze (0)
-        maze.destroy_wall(connected_cell[0], random_frontier_cell)
-        maze.grid[random_frontier_cell] = 0
-        # get neighbor cells of the random frontier cell that aren't in the maze yet and add them to the frontier.
-        new_fronts = [n for n in maze.neighbors(random_frontier_cell[0], random_frontier_cell[1]) if maze.grid[n] == 1]
-        for front in new_fronts:
-            frontier.add(front)
-        frontier.remove(random_frontier_cell)
-
-        if animate:
-            draw()
 
 def wilson(maze, extra_walker=False, animate=False):
     """
@@ -237,60 +321,389 @@ def wilson(maze, extra_walker=False, animate=False):
     Author:
         unknown/Sjoerd Beetsma
 
+    Works on the flat cell indices of the maze: visited cells in a list, not visited cells in a list with swap removal
+    to pick random cells in O(1), and the loop erasure done by storing the last exit direction of every cell.
+
     Args:
         maze: maze object which will be used to store the generated maze.
         extra_walker: use a extra random walker to generate the maze (aldolous broder algorithm)
         animate: animate the generating process, 0 (=False) or FPS as integer value."""
+    run_steps(wilson_steps(maze, extra_walker), maze, animate)
 
-    def draw():
-        """Custom draw function"""
-        draw_grid(win, maze.grid, tile_size)
-        for position in path:
-            pygame.draw.rect(win, RED, (position[1] * tile_size, position[0] * tile_size, tile_size, tile_size))
-        if extra_walker:
-            pygame.draw.rect(win, INDIGO,
-                             (extra_walker_pos[1] * tile_size, extra_walker_pos[0] * tile_size, tile_size, tile_size))
-        pygame.display.flip()
-
-    if animate: clock, tile_size, win = animation_setup_grid(maze.grid)
-    not_visited_cells = [(i, j) for i in range(1, maze.rows - 1, 2) for j in range(1, maze.cols - 1, 2)]
-    # pick a random start cell
-    start = random.sample(not_visited_cells, 1)[0]
+
+def wilson_steps(maze, extra_walker=False):
+    """step generator of wilson
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        extra_walker: use a extra random walker to generate the maze (aldolous broder algorithm)
+    Yields:
+        a step per step of the random walk (cell joining the walk, the extra walker moving and carving)
+        and a step per finished walk (carved cells and walls of the path, all marks removed)
+    """
+
+    def random_step(cell):
+        """returns the direction (index in offsets) of a random step from a cell that stays inside the maze"""
+        col = cell % maze.x
+        while True:
+            direction = maze.rng.randrange(4)
+            # out of bounds steps are retried, which gives every neighbor inside the maze the same chance
+            # (checked per direction: in a maze 1 cell wide the offsets of north/south and east/west are the same)
+            if (direction == 0 and cell >= maze.x) or (direction == 1 and col != maze.x - 1) or \
+                    (direction == 2 and cell + maze.x < maze.x * maze.y) or (direction == 3 and col != 0):
+                return direction
+
+    def carve(cell, next_cell=None):
+        """marks a cell as part of the maze and destroys the wall between it and the next cell (if given)
+        returns the carve events of the cell and wall"""
+        visited[cell] = True
+        # swap remove the cell from the not visited cells
+        last = not_visited_cells[-1]
+        not_visited_cells[not_visited_index[cell]] = last
+        not_visited_index[last] = not_visited_index[cell]
+        not_visited_cells.pop()
+        position = maze.cell_position(cell)
+        maze.grid[position] = 0
+        if next_cell is None:
+            return (CARVE, position),
+        wall = wall_between(position, maze.cell_position(next_cell))
+        maze.grid[wall] = 0
+        return (CARVE, position), (CARVE, wall)
+
+    # step offsets for flat cell indices (north, east, south, west)
+    offsets = [offset for wall, offset in maze.offsets]
+    # visited[cell] is True if the cell is part of the maze
+    visited = [False] * (maze.x * maze.y)
+    # not visited cells in a list together with every cell's index in that list so cells can be removed and picked at
+    # random in O(1)
+    not_visited_cells = list(range(maze.x * maze.y))
+    not_visited_index = list(range(maze.x * maze.y))
+    # direction the random walk last left every cell in, following the exits from the start of the walk gives the
+    # path without loops: when the walk returns to a cell its exit gets overwritten which cuts off the loop
+    exits = [0] * (maze.x * maze.y)
+    # number of the last walk that stepped on every cell (used by the extra walker to avoid Wilson's path)
+    walk_nr = [0] * (maze.x * maze.y)
+    walks = 0
+
+    # pick a random start cell and mark it as part of the maze (0)
+    start = maze.rng.randrange(maze.x * maze.y)
+    events = carve(start)
     # if extra_walker is activated the walk will start from this start position
     if extra_walker:
-        extra_walker_pos = start
-    # remove the start position from not_visited_cells and mark it as part of the maze (0)
-    not_visited_cells.remove(start)
-    maze.grid[start] = 0
+        extra_walker_cell = start
+        events += (WALKER, start),
+    yield events
 
     # while there are not visited cells left
-    while len(not_visited_cells) > 0:
-        # start the path at a random location
-        path = [random.sample(not_visited_cells, 1)[0]]
-        # current cell is the first element in the path
-        next_cell = path[0]
-        # while next_cell is not part of the maze keep randomly walking (without changing the maze)
-        while next_cell in not_visited_cells:
-            next_cell = maze.neighbors(next_cell[0], next_cell[1], True)[0]
-            # if the next_cell is in the path a loop is created cut off the path at the point of the loop and
-            # continue from there
-            if next_cell in path:
-                path = path[:path.index(next_cell)]
-            path.append(next_cell)
+    while not_visited_cells:
+        # start the walk at a random not visited cell
+        walk_start = not_visited_cells[maze.rng.randrange(len(not_visited_cells))]
+        current_cell = walk_start
+        walks += 1
+        walk_nr[current_cell] = walks
+        yield ACTIVE, current_cell
+        # while current_cell is not part of the maze keep randomly walking (without changing the maze)
+        while not visited[current_cell]:
+            exits[current_cell] = random_step(current_cell)
+            current_cell += offsets[exits[current_cell]]
+            walk_nr[current_cell] = walks
             # if extra walker is active make it go a next step
             if extra_walker:
-                extra_walker_pos = random_walker(maze, extra_walker_pos, path)
-                # if extra walker hasn't been visited yet remove it from not visited cells
-                if extra_walker_pos in not_visited_cells:
-                    not_visited_cells.remove(extra_walker_pos)
-            if animate:
-                clock.tick(animate), draw()
-        # for loop is reached when the path reaches a cell that is part of the maze(0)
-        # the positions in the path and walls between them get destroyed.
-        for i, pos in enumerate(path[:-1]):
-            maze.grid[pos] = 0
-            maze.destroy_wall(pos, path[i + 1])
-            not_visited_cells.remove(pos)
-        if animate:
-            clock.tick(animate)
-            draw()
+                events = (ACTIVE, current_cell),
+                next_cell = extra_walker_cell + offsets[random_step(extra_walker_cell)]
+                # avoid stepping into Wilson's walk, if the cell hasn't been visited yet the walker carves it out
+                if walk_nr[next_cell] != walks:
+                    if not visited[next_cell]:
+                        events += carve(next_cell, extra_walker_cell)
+                    events += (INACTIVE, extra_walker_cell), (WALKER, next_cell)
+                    extra_walker_cell = next_cell
+                yield events
+            else:
+                yield ACTIVE, current_cell
+        # the walk reached a cell that is part of the maze(0)
+        # the cells on the path and walls between them get carved out and the cells of the walk (loops included)
+        # unmarked
+        events = [(INACTIVE, None)]
+        cell = walk_start
+        while not visited[cell]:
+            next_cell = cell + offsets[exits[cell]]
+            events.extend(carve(cell, next_cell))
+            cell = next_cell
+        if extra_walker:
+            events.append((WALKER, extra_walker_cell))
+        yield tuple(events)
+
+
+def binary_tree(maze, animate=False):
+    """
+    Author:
+        unknown
+
+    Time Complexity:
+        O(N) Vertices
+
+    Space Complexity:
+        O(N) Vertices
+
+    Maze generation algorithm:
+        (6, vectorized)
+
+    The algorithm:
+        every cell carves out a passage to its north or east neighbor at random.
+        cells in the top row can only carve east and cells in the right column can only carve north
+        which leaves the top row and right column as long straight corridors.
+
+    Every cell makes its choice independently so the whole grid is carved at once with numpy operations.
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        animate: animate the generating process, 0 (=False) or FPS as integer value.
+    """
+    run_steps(binary_tree_steps(maze), maze, animate)
+
+
+def binary_tree_steps(maze):
+    """step generator of binary_tree
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a single step carving out the whole maze
+    """
+    # every cell is part of the maze
+    maze.grid[1::2, 1::2] = 0
+    # True: carve north, False: carve east
+    carve_north = maze.np_rng.random((maze.y, maze.x)) < 0.5
+    carve_north[:, -1] = True
+    carve_north[0, :] = False
+    carve_east = ~carve_north
+    carve_east[:, -1] = False
+    # walls north of the cells are on the even rows above them, walls east of the cells on the even cols right of them
+    maze.grid[0:-1:2, 1::2][carve_north] = 0
+    maze.grid[1::2, 2::2][carve_east] = 0
+    yield CARVE, slice(0, maze.rows)
+
+
+def sidewinder(maze, animate=False):
+    """
+    Author:
+        Walter D. Pullen
+
+    Time Complexity:
+        O(N) Vertices
+
+    Space Complexity:
+        O(N) Vertices
+
+    Maze generation algorithm:
+        (7, vectorized)
+
+    The algorithm:
+        the top row is one long corridor. every other row is split up in runs of cells by randomly carving passages east,
+        from every run one random cell carves a passage north. the top row has no walls between its cells.
+
+    The runs of all rows are found at once with numpy operations (a run ends at every cell that doesn't carve east,
+    the last cell of a row always ends its run) so the whole grid is carved without stepping through the cells.
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        animate: animate the generating process, 0 (=False) or FPS as integer value.
+    """
+    run_steps(sidewinder_steps(maze), maze, animate)
+
+
+def sidewinder_steps(maze):
+    """step generator of sidewinder
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a single step carving out the whole maze
+    """
+    # every cell is part of the maze and the top row is one corridor
+    maze.grid[1::2, 1::2] = 0
+    maze.grid[1, 1:-1] = 0
+    if maze.y > 1:
+        carve_east = maze.np_rng.random((maze.y - 1, maze.x)) < 0.5
+        carve_east[:, -1] = False
+        maze.grid[3::2, 2::2][carve_east] = 0
+        # flat index (over the rows below the top row) of the last and first cell of every run
+        run_ends = np.flatnonzero(~carve_east.ravel())
+        run_starts = np.concatenate(([0], run_ends[:-1] + 1))
+        # random cell of every run carves north
+        chosen = run_starts + (maze.np_rng.random(len(run_starts)) * (run_ends - run_starts + 1)).astype(int)
+        carve_north = np.zeros(carve_east.size, dtype=bool)
+        carve_north[chosen] = True
+        maze.grid[2:-1:2, 1::2][carve_north.reshape(carve_east.shape)] = 0
+    yield CARVE, slice(0, maze.rows)
+
+
+def eller(maze, animate=False):
+    """
+    Author:
+        Marlin Eller (1982)
+
+    Time Complexity:
+        O(N) Vertices
+
+    Space Complexity:
+        O(X) cells in a row
+
+    Maze generation algorithm:
+        (8, row by row)
+
+    The algorithm:
+        carves the maze one row at a time keeping track of which cells in the row are connected (in the same set).
+        neighboring cells of different sets are joined at random, then every set carves at least one passage down
+        to the next row. cells in the next row that aren't reached from above start a new set.
+        in the last row all neighboring cells of different sets are joined.
+
+    Every row is carved with numpy operations, only joining the sets within a row is done cell by cell
+    (with a union find over the set labels of the row).
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        animate: animate the generating process, 0 (=False) or FPS as integer value.
+    """
+    run_steps(eller_steps(maze), maze, animate)
+
+
+def eller_steps(maze):
+    """step generator of eller
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a step per carved out row (the passages in the row and down to the next row)
+    """
+
+    def find(label):
+        """root label of a set (with path halving)"""
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    # every cell is part of the maze
+    maze.grid[1::2, 1::2] = 0
+    # set label of every cell in the current row, labels are kept below 2 * x
+    labels = np.arange(maze.x)
+    for row in range(maze.y):
+        last_row = row == maze.y - 1
+        # join neighboring cells of different sets (at random, in the last row always)
+        parent = list(range(2 * maze.x))
+        row_labels = labels.tolist()
+        join = labels[:-1] != labels[1:]
+        if not last_row:
+            join &= maze.np_rng.random(maze.x - 1) < 0.5
+        joined = np.zeros(maze.x - 1, dtype=bool)
+        for i in np.flatnonzero(join).tolist():
+            a, b = find(row_labels[i]), find(row_labels[i + 1])
+            # cells already connected through joins earlier in this row would create a loop
+            if a != b:
+                parent[b] = a
+                joined[i] = True
+        maze.grid[2 * row + 1, 2:-1:2][joined] = 0
+        if last_row:
+            yield CARVE, slice(2 * row + 1, 2 * row + 3)
+            break
+        # relabel the sets of the row to 0 ... number of sets - 1
+        labels = np.unique([find(label) for label in row_labels], return_inverse=True)[1].ravel()
+        # every set carves down at least once: one random cell of each set plus random other cells
+        order = maze.np_rng.permutation(maze.x)
+        carve_down = maze.np_rng.random(maze.x) < 0.5
+        carve_down[order[np.unique(labels[order], return_index=True)[1]]] = True
+        maze.grid[2 * row + 2, 1::2][carve_down] = 0
+        # cells of the next row keep the set of the cell above them or start a new set
+        labels = np.where(carve_down, labels, maze.x + np.arange(maze.x))
+        yield CARVE, slice(2 * row + 1, 2 * row + 3)
+
+
+def kruskal(maze, animate=False):
+    """
+    Author:
+        Joseph Kruskal (1956)
+
+    Time Complexity:
+        O(N α(N)) Vertices (α: inverse Ackermann function, at most 4 for any maze that fits in memory)
+
+    Space Complexity:
+        O(N) Vertices
+
+    Maze generation algorithm:
+        (9, bulk)
+
+    The algorithm:
+        every cell starts as its own set. the walls between neighboring cells are visited in random order,
+        if the cells on both sides of a wall are in different sets the wall is removed and the sets are joined.
+        when all cells are in one set the maze is finished.
+
+    The sets are a disjoint set (union find) over the flat cell indices (parents in a list, ranks in a bytearray)
+    with union by rank and path halving, the walls are shuffled at once with numpy and the removed walls are carved
+    out in bulk.
+    The union find itself visits the walls one by one in Python (almost all 2N walls get visited), so for large
+    mazes it is the slowest of the bulk algorithms.
+    Args:
+        maze: maze object which will be used to store the generated maze.
+        animate: animate the generating process, 0 (=False) or FPS as integer value.
+    """
+    run_steps(kruskal_steps(maze), maze, animate)
+
+
+def kruskal_steps(maze):
+    """step generator of kruskal
+    Args:
+        maze: maze object which will be used to store the generated maze.
+    Yields:
+        a step per x removed walls (the removed walls carved out in bulk)
+    """
+
+    def carve(removed):
+        """carves out removed walls given as pairs of the flat index of the cell west/north of them and the neighbor"""
+        removed = np.array(removed).reshape(-1, 2)
+        # the wall is next to the first cell, below it (south) or else on the right of it (east)
+        south = removed[:, 1] - removed[:, 0] == maze.x
+        positions = np.stack((removed[:, 0] // maze.x * 2 + 1 + south, removed[:, 0] % maze.x * 2 + 1 + ~south), axis=1)
+        maze.grid[positions[:, 0], positions[:, 1]] = 0
+        return positions
+
+    cells = maze.x * maze.y
+    # every cell is part of the maze
+    maze.grid[1::2, 1::2] = 0
+    yield CARVE, slice(0, maze.rows)
+    # walls between every cell and its east neighbor and between every cell and its south neighbor, shuffled
+    east = np.flatnonzero(np.arange(cells) % maze.x != maze.x - 1)
+    south = np.arange(cells - maze.x)
+    order = maze.np_rng.permutation(len(east) + len(south))
+    walls_from = np.concatenate((east, south)).astype(np.int32)[order]
+    walls_to = np.concatenate((east + 1, south + maze.x)).astype(np.int32)[order]
+    # the walls are turned into Python ints a slice at a time instead of all at once (2N boxed ints)
+    slice_size = 1 << 16
+    walls = itertools.chain.from_iterable(
+        zip(walls_from[start:start + slice_size].tolist(), walls_to[start:start + slice_size].tolist())
+        for start in range(0, len(order), slice_size))
+    parent = list(range(cells))
+    # ranks stay below log2(cells), 1 byte each
+    rank = bytearray(cells)
+    joined = 1
+    removed = []
+    # the removed walls are carved out every x walls (2 cells per wall)
+    batch = 2 * maze.x
+    for cell, neighbor in walls:
+        # roots of the sets of both cells, inlined because this loop runs once per wall. every cell on the way gets
+        # its grandparent as parent (path halving)
+        root = cell
+        while parent[root] != root:
+            parent[root] = root = parent[parent[root]]
+        neighbor_root = neighbor
+        while parent[neighbor_root] != neighbor_root:
+            parent[neighbor_root] = neighbor_root = parent[parent[neighbor_root]]
+        if root == neighbor_root:
+            continue
+        # union by rank: the lower tree is hung under the root of the higher tree
+        if rank[root] < rank[neighbor_root]:
+            root, neighbor_root = neighbor_root, root
+        parent[neighbor_root] = root
+        if rank[root] == rank[neighbor_root]:
+            rank[root] += 1
+        removed += cell, neighbor
+        joined += 1
+        if len(removed) == batch or joined == cells:
+            yield CARVE, carve(removed)
+            removed = []
+        # all cells are in one set, the rest of the walls stay
+        if joined == cells:
+            break
@@ -1,96 +1,101 @@
 """Module containing different algorithms to solve mazes"""
 
+import heapq
+from collections import deque
+
 from maze_game.animate_helpers import *
 
-def breadth_first_search(maze, start_pos, animate=False):
+
+def breadth_first_search(maze, start_pos, animate=False, stats=None):
     """
     Authors: Konrad Zuse (1945), Edward F. Moore (1959)
 
     Time Complexity O(N): Vertices + Edges
 
-    Space Complexity O(N): Vertices + Edges
+    Space Complexity O(N): Vertices
 
     The Algorithm:
-        starts at a given start cell and spreads out to not visited neighboring cells marking their distance from the start cell
+        starts at a given start cell and spreads out to not visited neighboring cells storing from which cell they were reached
         these neighbor cells repeat the process until the end of the maze is found then the algorithm
-        travels back the shortest path to the start end stores it's path
+        follows the stored cells back from the end to the start to get the shortest path
+
+    Every cell is added to and taken from the (FIFO) queue at most once and the visited cells are stored in a
+    parent list over the flat cell indices, so the search runs in linear time.
 
     Args:
         maze:   maze object which will be used to store the generated maze.
         start_pos: position in the maze where to start the pathfinding from
         animate: animate the generating process, False or FPS as integer value.
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
 
     Returns:
         the shortest path from start_position the the maze end in the form of a list with grid positions
         example: [(1,1),(2,1),...(5,5)]
+        None if the end can't be reached
         """
+    return run_steps(breadth_first_search_steps(maze, start_pos, stats), maze, animate, (start_pos, maze.end))
 
-    def draw():
-        """custom draw function"""
-        draw_grid(win, maze.grid, tile_size)
-        for pos in [pos for pos in dist_from_start if dist_from_start[pos] != float('inf')]:
-            pygame.draw.rect(win, BLUE, (pos[1] * tile_size, pos[0] * tile_size, tile_size, tile_size))
-        draw_start_finish(win, tile_size, start_pos, maze.end)
-        clock.tick(animate)
-        pygame.display.flip()
-
-    if animate:
-        clock, tile_size, win = animation_setup_grid(maze.grid)
-        draw_grid(win, maze.grid, tile_size)
-    # adj_lst is a @property so store it in a separate variable to not generate the same adj_lst over and over.
-    adj_lst = maze.adj_lst
-    # each cell's distance from the start used to traverse the graph and also check if cells have been visited
-    # (dist != inf)
-    dist_from_start = {pos: float('inf') for pos in adj_lst.keys()}
-    # queue data type to store which cells to visit next
-    queue = [start_pos]
-    # start cell has a distance of 0 to start cell
-    dist_from_start[start_pos] = 0
-
-    # while the queue is not empty
-    while queue:
-        current = queue[0]
-        queue.remove(current)
-        # for each connected open (0) cell to the current cell
-        for connected_cell in adj_lst[current]:
-            # if not visited
-            if dist_from_start[connected_cell] == float('inf'):
-                # store distances of the connected cell and add to queue
-                dist_from_start[connected_cell] = dist_from_start[current] + 1
-                queue.append(connected_cell)
-                # if the shortest path to target cell is found stop loop by making queue empty.
-                if connected_cell == maze.end:
-                    queue = []
-                    break
-        if animate:
-            draw()
-
-    # get shortest path from end to start by traversing the graph starting from the end and going to the cell with the shortest
-    # distance from start
-    current = maze.end
-    path = [current]
-    # step through the maze i times from the end of the found path to the start
-    for i in range(dist_from_start[maze.end]):
-        # which connection from the current point has the lowest distance? move to that direction and repeat
-        # until the start of the maze is reached. (distance from start)
-        # store connected cells from the current cell and their distances from start
-        # {cell position: distance from start}
-        connected_cells = {pos: dist_from_start[pos] for pos in adj_lst[current]}
-        # move to connected cell with lowest distance from start
-        next_cell = (min(connected_cells, key=connected_cells.get))
-        current = next_cell
-        path.append(next_cell)
-
-    # reverse the path so path becomes in order [start, ... , end]
-    path.reverse()
-    if animate:
-        for pos in path[1:-1]:
-            pygame.draw.rect(win, INDIGO, (pos[1] * tile_size, pos[0] * tile_size, tile_size, tile_size))
-        pygame.display.flip()
+
+def breadth_first_search_steps(maze, start_pos, stats=None):
+    """step generator of breadth_first_search
+    Args:
+        maze:   maze object which will be used to store the generated maze.
+        start_pos: position in the maze where to start the pathfinding from
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
+    Yields:
+        a step per expanded cell (cell visited) and a last step with the path if the end was reached
+    Returns:
+        the shortest path (see breadth_first_search), None if the end can't be reached
+    """
+    # the search runs over the flat cell indices of the maze, passages are added back when the path is known
+    # (a start on a passage starts from both cells next to it)
+    start_cells = maze.start_cells(*start_pos)
+    end = maze.cell_index(*maze.end)
+    # packed walls as bytes: indexing bytes is a lot faster than indexing a numpy array one element at a time
+    walls = maze.walls.tobytes()
+    offsets = maze.offsets
+    # each cell's parent: the cell it was reached from, also used to check if cells have been visited (parent != -1)
+    parent = [-1] * (maze.x * maze.y)
+    # the start cells are their own parent
+    for start in start_cells:
+        parent[start] = start
+    # FIFO queue to store which cells to visit next
+    queue = deque(start_cells)
+
+    # while the queue is not empty and the end hasn't been reached
+    expanded = 0
+    while queue and parent[end] == -1:
+        current = queue.popleft()
+        expanded += 1
+        yield VISIT, current
+        # for each cell connected to the current cell (no wall in between)
+        for wall, offset in offsets:
+            if not walls[current] & wall:
+                connected_cell = current + offset
+                # if not visited store where it was reached from and add it to the queue
+                if parent[connected_cell] == -1:
+                    parent[connected_cell] = current
+                    queue.append(connected_cell)
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if parent[end] == -1:
+        return None
+    # get shortest path from end to start by following the parents from the end back to a start cell
+    current = end
+    cells = [current]
+    while parent[current] != current:
+        current = parent[current]
+        cells.append(current)
+
+    # reverse the path so path becomes in order [start, ... , end] and add the passages between the cells
+    cells.reverse()
+    path = maze.cells_to_path(cells, start_pos)
+    yield tuple((PATH, position) for position in path[1:-1])
     return path
 
 
-def depth_first_search(maze, start_pos, animate=False):
+def depth_first_search(maze, start_pos, animate=False, stats=None):
     """
     Author: Charles Pierre Trémaux (1876)
 
@@ -107,47 +112,260 @@ def depth_first_search(maze, start_pos, animate=False):
         maze:   maze object which will be used to store the generated maze.
         start_pos: position in the maze where to start the pathfinding from
         animate: animate the generating process, False or FPS as integer value.
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
 
     Returns:
         path from start_position the the maze end in the form of a list with grid positions
         example: [(1,1),(2,1),...(5,5)]
     """
+    return run_steps(depth_first_search_steps(maze, start_pos, stats), maze, animate, (start_pos, maze.end))
+
 
-    def draw(stack_color=BLUE):
-        draw_grid(win, maze.grid, tile_size)
-        for pos in stack:
-            pygame.draw.rect(win, stack_color, (pos[1] * tile_size, pos[0] * tile_size, tile_size, tile_size))
-        draw_start_finish(win, tile_size, start_pos, maze.end)
-        clock.tick(animate)
-        pygame.display.flip()
-
-    if animate:
-        clock, tile_size, win = animation_setup_grid(maze.grid)
-    # stack to store the last steps taken to go back when running into a dead-end
-    stack = [start_pos]
-    # adj_lst is a @property so store it in a separate variable to not generate the same adj_lst over and over.
-    adj_lst = maze.adj_lst
-    visited = {start_pos: True}
+def depth_first_search_steps(maze, start_pos, stats=None):
+    """step generator of depth_first_search
+    Args:
+        maze:   maze object which will be used to store the generated maze.
+        start_pos: position in the maze where to start the pathfinding from
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
+    Yields:
+        a step per cell pushed on the stack (cell visited) and popped from the stack, and a last step with the path if the end was reached
+    Returns:
+        path (see depth_first_search), None if the end can't be reached
+    """
+    # the search runs over the flat cell indices of the maze, passages are added back when the path is known
+    start = maze.cell_index(*start_pos)
+    end = maze.cell_index(*maze.end)
+    # packed walls of every cell (see Maze.walls) and the index offset to the neighbor behind every wall
+    walls = maze.walls.tobytes()
+    offsets = maze.offsets
+    # stack to store the last steps taken to go back when running into a dead-end, it is the path to the current cell
+    stack = [start]
+    visited = bytearray(maze.x * maze.y)
+    visited[start] = 1
+    expanded = 1
+    yield VISIT, start
     # continue until a path is found and return stack(==path) or stack is empty (no solution and return none)
     while stack:
         # current cell is most recent element appended to the stack
         current_cell = stack[-1]
         # if maze end is found
-        if current_cell == maze.end:
-            # draw the path in the non-standard color to make the solution a different color when animating
-            if animate:
-                draw(INDIGO)
-            return stack
-        # get neighbors/connected open cells(0) that haven't been visited yet
-        unvisited_neighbors = [connected_cell for connected_cell in adj_lst[current_cell] if
-                               visited.get(connected_cell) is None]
+        if current_cell == end:
+            if stats is not None:
+                stats['expanded'] = expanded
+            path = maze.cells_to_path(stack, start_pos)
+            yield tuple((PATH, position) for position in path[1:-1])
+            return path
+        # the first connected cell (no wall in between) that hasn't been visited yet becomes the next cell
+        # (neighbors in the order north, east, south, west)
+        cell_walls = walls[current_cell]
+        for wall, offset in offsets:
+            next_cell = current_cell + offset
+            if not cell_walls & wall and not visited[next_cell]:
+                stack.append(next_cell)
+                visited[next_cell] = 1
+                expanded += 1
+                yield VISIT, next_cell
+                break
         # if there are none pop from stack
-        if len(unvisited_neighbors) == 0:
-            stack = stack[:-1]
-        # a random unvisited neighbor becomes the next cell
         else:
-            next_cell = unvisited_neighbors[0]
-            stack.append(next_cell)
-            visited[next_cell] = True
-        if animate:
-            draw()
+            stack.pop()
+            yield INACTIVE, current_cell
+    if stats is not None:
+        stats['expanded'] = expanded
+
+
+def a_star(maze, start_pos, animate=False, stats=None):
+    """
+    Authors: Peter Hart, Nils Nilsson, Bertram Raphael (1968)
+
+    Time Complexity O(N log N): Vertices (priority queue)
+
+    Space Complexity O(N): Vertices
+
+    The algorithm:
+        like breadth first search but instead of spreading out evenly the cell with the lowest
+        distance from the start + estimated distance to the end (Manhattan distance) gets expanded first.
+        the search heads straight to the end and only spreads out where walls are in the way.
+
+    Args:
+        maze:   maze object which will be used to store the generated maze.
+        start_pos: position in the maze where to start the pathfinding from
+        animate: animate the generating process, False or FPS as integer value.
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
+
+    Returns:
+        the shortest path from start_position the the maze end in the form of a list with grid positions
+        example: [(1,1),(2,1),...(5,5)]
+        None if the end can't be reached
+    """
+    return run_steps(a_star_steps(maze, start_pos, stats), maze, animate, (start_pos, maze.end))
+
+
+def a_star_steps(maze, start_pos, stats=None):
+    """step generator of a_star
+    Args:
+        maze:   maze object which will be used to store the generated maze.
+        start_pos: position in the maze where to start the pathfinding from
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
+    Yields:
+        a step per expanded cell (cell visited) and a last step with the path if the end was reached
+    Returns:
+        the shortest path (see a_star), None if the end can't be reached
+    """
+    # a start on a passage starts from both cells next to it
+    start_cells = maze.start_cells(*start_pos)
+    end = maze.cell_index(*maze.end)
+    end_row, end_col = divmod(end, maze.x)
+    walls = maze.walls.tobytes()
+    offsets = maze.offsets
+    # each cell's parent (-1 == not reached yet) and distance from the start
+    parent = [-1] * (maze.x * maze.y)
+    dist_from_start = [0] * (maze.x * maze.y)
+    for start in start_cells:
+        parent[start] = start
+    # priority queue of (estimated path length, -distance from start, cell). on equal estimates the cell furthest
+    # from the start goes first, which keeps the search on the path it is following
+    queue = [(0, 0, start) for start in start_cells]
+    expanded = 0
+
+    while queue:
+        estimate, dist, current = heapq.heappop(queue)
+        # cells can be in the queue more than once, skip the entries with an outdated distance
+        if -dist != dist_from_start[current]:
+            continue
+        expanded += 1
+        yield VISIT, current
+        if current == end:
+            break
+        for wall, offset in offsets:
+            if not walls[current] & wall:
+                connected_cell = current + offset
+                if parent[connected_cell] == -1 or dist_from_start[current] + 1 < dist_from_start[connected_cell]:
+                    parent[connected_cell] = current
+                    dist_from_start[connected_cell] = dist_from_start[current] + 1
+                    row, col = divmod(connected_cell, maze.x)
+                    # Manhattan distance to the end as heuristic, never more than the real distance
+                    heuristic = abs(end_row - row) + abs(end_col - col)
+                    heapq.heappush(queue, (dist_from_start[connected_cell] + heuristic,
+                                           -dist_from_start[connected_cell], connected_cell))
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if parent[end] == -1:
+        return None
+    current = end
+    cells = [current]
+    while parent[current] != current:
+        current = parent[current]
+        cells.append(current)
+    cells.reverse()
+    path = maze.cells_to_path(cells, start_pos)
+    yield tuple((PATH, position) for position in path[1:-1])
+    return path
+
+
+def bidirectional_search(maze, start_pos, animate=False, stats=None):
+    """
+    Author: Ira Pohl (1971)
+
+    Time Complexity O(N): Vertices + Edges
+
+    Space Complexity O(N): Vertices
+
+    The algorithm:
+        two breadth first searches, one from the start and one from the end of the maze.
+        each round the search with the smallest frontier spreads out one level, when the searches meet
+        the path is the path from the start to the meeting cell followed by the path from the meeting cell to the end.
+
+    Args:
+        maze:   maze object which will be used to store the generated maze.
+        start_pos: position in the maze where to start the pathfinding from
+        animate: animate the generating process, False or FPS as integer value.
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
+
+    Returns:
+        the shortest path from start_position the the maze end in the form of a list with grid positions
+        example: [(1,1),(2,1),...(5,5)]
+        None if the end can't be reached
+    """
+    return run_steps(bidirectional_search_steps(maze, start_pos, stats), maze, animate, (start_pos, maze.end))
+
+
+def bidirectional_search_steps(maze, start_pos, stats=None):
+    """step generator of bidirectional_search
+    Args:
+        maze:   maze object which will be used to store the generated maze.
+        start_pos: position in the maze where to start the pathfinding from
+        stats: optional dict in which the number of expanded cells gets stored as stats['expanded']
+    Yields:
+        a step per level one of the searches spreads out (cells visited from the start or from the end)
+        and a last step with the path if the searches met
+    Returns:
+        the shortest path (see bidirectional_search), None if the end can't be reached
+    """
+    # a start on a passage starts from both cells next to it
+    start_cells = maze.start_cells(*start_pos)
+    end = maze.cell_index(*maze.end)
+    walls = maze.walls.tobytes()
+    offsets = maze.offsets
+    # parents and distances of the search from the start and of the search from the end
+    parent_start, parent_end = [-1] * (maze.x * maze.y), [-1] * (maze.x * maze.y)
+    dist_start, dist_end = [0] * (maze.x * maze.y), [0] * (maze.x * maze.y)
+    for start in start_cells:
+        parent_start[start] = start
+    parent_end[end] = end
+    frontier_start, frontier_end = list(start_cells), [end]
+    # cell where the searches meet
+    meeting_cell = end if end in start_cells else -1
+    expanded = 0
+
+    while frontier_start and frontier_end and meeting_cell == -1:
+        # spread out the search with the smallest frontier
+        if len(frontier_start) <= len(frontier_end):
+            frontier, parent, dist, other_parent, other_dist = frontier_start, parent_start, dist_start, parent_end, dist_end
+        else:
+            frontier, parent, dist, other_parent, other_dist = frontier_end, parent_end, dist_end, parent_start, dist_start
+        next_frontier = []
+        # shortest path length through a cell where the searches met in this level
+        shortest = -1
+        for current in frontier:
+            expanded += 1
+            for wall, offset in offsets:
+                if not walls[current] & wall:
+                    connected_cell = current + offset
+                    if parent[connected_cell] == -1:
+                        parent[connected_cell] = current
+                        dist[connected_cell] = dist[current] + 1
+                        next_frontier.append(connected_cell)
+                        # the other search already reached this cell: the searches meet.
+                        # finish the level and keep the meeting cell with the shortest path
+                        if other_parent[connected_cell] != -1 and \
+                                (shortest == -1 or dist[connected_cell] + other_dist[connected_cell] < shortest):
+                            shortest = dist[connected_cell] + other_dist[connected_cell]
+                            meeting_cell = connected_cell
+        if frontier is frontier_start:
+            frontier_start = next_frontier
+            yield tuple((VISIT, cell) for cell in next_frontier)
+        else:
+            frontier_end = next_frontier
+            yield tuple((VISIT_END, cell) for cell in next_frontier)
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if meeting_cell == -1:
+        return None
+    # path from the start to the meeting cell followed by the path from the meeting cell to the end
+    cells = [meeting_cell]
+    while parent_start[cells[-1]] != cells[-1]:
+        cells.append(parent_start[cells[-1]])
+    cells.reverse()
+    while cells[-1] != end:
+        cells.append(parent_end[cells[-1]])
+    path = maze.cells_to_path(cells, start_pos)
+    yield tuple((PATH, position) for position in path[1:-1])
+    return path
+
+
+# solvers by name
+solvers = {'bfs': breadth_first_search, 'dfs': depth_first_search, 'a_star': a_star,
+           'bidirectional': bidirectional_search}
@@ -0,0 +1,73 @@
+"""Module to compute statistics of mazes used to rate them and compare the generation algorithms"""
+
+import numpy as np
+
+# number of open sides (passages) of a cell for every combination of wall bits (see Maze.walls)
+OPEN_SIDES = np.array([4 - bin(walls).count('1') for walls in range(16)], dtype=np.uint8)
+
+
+def farthest_cell(maze, start):
+    """breadth first search over the whole maze from a cell (see Maze.distances)
+    Args:
+        maze: Maze object
+        start: flat index of the cell to start from
+    Returns:
+        flat index of the cell farthest from the start, distance to it (number of steps)"""
+    # distances of the cells in grid steps, 2 per step from cell to cell
+    cell_dist = maze.distances(maze.cell_position(start))[1::2, 1::2].ravel()
+    farthest = int(np.argmax(cell_dist))
+    return farthest, int(cell_dist[farthest]) // 2
+
+
+def degree_stats(walls):
+    """statistics counted from the number of passages of every cell, for one maze or a batch of mazes at once
+    Args:
+        walls: packed walls (see Maze.walls) of a maze (1d numpy array) or of a batch of mazes ((n, x * y) numpy array)
+    Returns:
+        dict with (per maze) dead_ends: number of cells with 1 passage, junctions: number of cells with 3 or 4 passages,
+        branching_factor: average number of ways to go on (passages - 1) from the cells that aren't dead ends,
+        river_factor: share of the cells that are corridor cells (2 passages): mazes with a high river factor have
+        long winding corridors, mazes with a low river factor branch off a lot with short dead ends"""
+    degree = OPEN_SIDES[walls]
+    dead_ends = np.count_nonzero(degree == 1, axis=-1)
+    junctions = np.count_nonzero(degree >= 3, axis=-1)
+    corridors = np.count_nonzero(degree == 2, axis=-1)
+    ways_on = np.sum(np.maximum(degree.astype(np.int64) - 1, 0), axis=-1)
+    other_cells = np.maximum(degree.shape[-1] - dead_ends, 1)
+    return {'dead_ends': dead_ends, 'junctions': junctions, 'branching_factor': ways_on / other_cells,
+            'river_factor': corridors / degree.shape[-1]}
+
+
+def maze_stats(maze):
+    """statistics of a perfect maze
+    Args:
+        maze: Maze object
+    Returns:
+        dict with dead_ends, junctions, branching_factor, river_factor (see degree_stats),
+        solution_length: number of steps (cell to cell) from the start to the end,
+        diameter: number of steps of the longest path in the maze. found with 2 breadth first searches: the cell
+        farthest from any cell is an end of a longest path (in a tree), the cell farthest from it is the other end"""
+    stats = {name: value.item() for name, value in degree_stats(maze.walls).items()}
+    stats['solution_length'] = int(maze.distance_field[0][maze.cell_index(*maze.start)])
+    one_end, _ = farthest_cell(maze, 0)
+    stats['diameter'] = farthest_cell(maze, one_end)[1]
+    return stats
+
+
+def batch_stats(mazes):
+    """statistics of a batch of perfect mazes, the counts of mazes of the same size are computed at once
+    Args:
+        mazes: list of Maze objects
+    Returns:
+        dict with a numpy array per statistic (see maze_stats), one value per maze"""
+    stats = {name: np.zeros(len(mazes), dtype=float if name in ('branching_factor', 'river_factor') else int)
+             for name in ('dead_ends', 'junctions', 'branching_factor', 'river_factor', 'solution_length', 'diameter')}
+    sizes = dict()
+    for i, maze in enumerate(mazes):
+        sizes.setdefault((maze.x, maze.y), []).append(i)
+        stats['solution_length'][i] = maze.distance_field[0][maze.cell_index(*maze.start)]
+        stats['diameter'][i] = farthest_cell(maze, farthest_cell(maze, 0)[0])[1]
+    for indices in sizes.values():
+        for name, values in degree_stats(np.stack([mazes[i].walls for i in indices])).items():
+            stats[name][indices] = values
+    return stats
@@ -0,0 +1,92 @@
+"""Module to answer path and distance queries between any 2 cells of a perfect maze using the maze as a tree"""
+
+import numpy as np
+
+
+class MazeTree:
+    """ Tree index of a perfect maze: a perfect maze is a spanning tree of its cells, here rooted at the end of the maze.
+    The parents and depths come from the distance field of the maze (next cell towards the end and distance to it).
+    The lowest common ancestor of 2 cells is found with binary lifting: up[k] holds the ancestor 2^k steps up of every
+    cell, so any cell can be lifted to any depth in O(log n) steps. The path between 2 cells runs up from both cells to
+    their lowest common ancestor, which gives the distance as depth[a] + depth[b] - 2 * depth[lca].
+    All queries take flat cell indices as ints or numpy arrays (a batch of queries at once).
+
+    Attributes:
+        maze (Maze): the indexed maze
+        depth (1d numpy array): distance of every cell to the root (the end), -1 if the cell isn't connected to it
+        parent (1d numpy array): next cell towards the root of every cell, the root and not connected cells are their
+                                 own parent
+        up (2d numpy array): up[k][cell] is the ancestor 2^k steps above the cell (or the root), (levels, x * y) int32
+    """
+
+    def __init__(self, maze):
+        """
+        builds the index from the distance field of a maze. takes O(n log n) time and memory for n cells
+        Args:
+            maze (Maze): maze to index, should be a perfect maze
+        """
+        self.maze = maze
+        self.depth, parent = maze.distance_field
+        # cells that can't reach the end have no ancestors
+        self.parent = np.where(parent == -1, np.arange(len(parent), dtype=np.int32), parent)
+        levels = max(int(self.depth.max()).bit_length(), 1)
+        self.up = np.empty((levels, len(parent)), dtype=np.int32)
+        self.up[0] = self.parent
+        for k in range(1, levels):
+            self.up[k] = self.up[k - 1][self.up[k - 1]]
+
+    def lca(self, a, b):
+        """lowest common ancestor of cells, O(log n) per query
+        Args:
+            a: flat index of the first cell (int or numpy array)
+            b: flat index of the second cell (int or numpy array, same shape as a)
+        Returns:
+            flat index of the lowest common ancestor (int or numpy array), -1 if a cell isn't connected to the root"""
+        a, b = np.asarray(a), np.asarray(b)
+        scalar = a.ndim == 0 and b.ndim == 0
+        a, b = np.atleast_1d(a).astype(np.int64), np.atleast_1d(b).astype(np.int64)
+        # lift the deepest cell of every pair up to the depth of the other cell
+        deeper = self.depth[a] < self.depth[b]
+        a, b = np.where(deeper, b, a), np.where(deeper, a, b)
+        diff = self.depth[a] - self.depth[b]
+        for k in range(len(self.up)):
+            a = np.where(diff >> k & 1 == 1, self.up[k][a], a)
+        # lift both cells as far as possible while they don't meet, then their parent is the common ancestor
+        for k in reversed(range(len(self.up))):
+            up_a, up_b = self.up[k][a], self.up[k][b]
+            differ = up_a != up_b
+            a, b = np.where(differ, up_a, a), np.where(differ, up_b, b)
+        lca = np.where(a == b, a, self.parent[a])
+        lca = np.where((self.depth[a] == -1) | (self.depth[b] == -1), -1, lca)
+        return int(lca[0]) if scalar else lca
+
+    def distance(self, a, b):
+        """number of steps (cell to cell) between cells, O(log n) per query
+        Args:
+            a: flat index of the first cell (int or numpy array)
+            b: flat index of the second cell (int or numpy array, same shape as a)
+        Returns:
+            distance (int or numpy array), -1 if a cell isn't connected to the root"""
+        lca = np.asarray(self.lca(a, b))
+        distance = np.where(lca == -1, -1, self.depth[a] + self.depth[b] - 2 * self.depth[lca])
+        return int(distance) if distance.ndim == 0 else distance
+
+    def path(self, start_pos, end_pos):
+        """path between 2 positions in the maze, O(path length) after finding the lowest common ancestor
+        Args:
+            start_pos: position in the maze where the path starts (a cell or passage)
+            end_pos: position of the cell where the path ends
+        Returns:
+            the path as a list of grid positions example: [(1,1),(2,1),...(5,5)]
+            None if the cells aren't connected"""
+        a, b = self.maze.cell_index(*start_pos), self.maze.cell_index(*end_pos)
+        lca = self.lca(a, b)
+        if lca == -1:
+            return None
+        # up from the start to the common ancestor, then down to the end (up from the end reversed)
+        cells, end_cells = [a], [b]
+        while cells[-1] != lca:
+            cells.append(int(self.parent[cells[-1]]))
+        while end_cells[-1] != lca:
+            end_cells.append(int(self.parent[end_cells[-1]]))
+        return self.maze.cells_to_path(cells + end_cells[-2::-1], start_pos)
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from maze_game import animate_helpers
+from maze_game.animate_helpers import start_recording, stop_recording, Recording, BLACK, WHITE, RED
+from maze_game.maze_logic.maze import Maze
+from maze_game.maze_logic.maze_solvers import breadth_first_search
+
+
+class TestRecording(unittest.TestCase):
+    """Test class for recording animations without a screen"""
+    def tearDown(self):
+        stop_recording()
+
+    def test_record_generator(self):
+        recording = start_recording()
+        maze = Maze(6, 5, 1, animate=1, seed=3)
+        self.assertIs(stop_recording(), recording)
+        self.assertIsNone(animate_helpers.recording)
+        # depth first search takes a step for the start, every other cell it carves out and every backtrack
+        self.assertEqual(len(recording.cells), 2 * 6 * 5)
+        self.assertEqual(recording.shape, (11, 13))
+        # first step has every tile, the last frame is the finished maze
+        self.assertEqual(len(recording.cells[0]), 11 * 13)
+        frames = recording.frame_stack()
+        self.assertEqual(frames.shape, (60, 11, 13, 3))
+        self.assertTrue(np.array_equal(frames[-1], np.where(maze.grid[:, :, None] == 1, BLACK, WHITE)))
+        self.assertEqual(recording.frame_stack(tile_size=3).shape, (60, 33, 39, 3))
+
+    def test_save_load(self):
+        maze = Maze(6, 5, 1, seed=3)
+        recording = start_recording()
+        breadth_first_search(maze, maze.start, animate=1)
+        stop_recording()
+        self.assertIn(RED, recording.palette)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'recording.npz')
+            recording.save(path)
+            loaded = Recording.load(path)
+            self.assertTrue(np.array_equal(loaded.frame_stack(), recording.frame_stack()))
+            recording.save_png(os.path.join(directory, 'frames'), tile_size=2)
+            self.assertEqual(len(os.listdir(os.path.join(directory, 'frames'))), len(recording.cells))
+
+    # only comparing the positions drawn on records the same changes as comparing the whole frame
+    def test_dirty_positions(self):
+        full, dirty = Recording(), Recording()
+        frame = np.zeros((5, 7, 3), dtype=np.uint8)
+        full.add_step(frame)
+        dirty.add_step(frame)
+        frame[2, 3] = RED
+        frame[4, 0] = WHITE
+        full.add_step(frame)
+        dirty.add_step(frame, np.array([[2, 3], [4, 0], [1, 1], [2, 3]]))
+        self.assertEqual(dirty.cells[-1].tolist(), [2 * 7 + 3, 4 * 7])
+        self.assertTrue(np.array_equal(full.frame_stack(), dirty.frame_stack()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from maze_game.maze_logic.maze import Maze
+from maze_game.maze_logic.chunked_maze import ChunkedMaze
+
+
+# test class to test mazes generated in chunks
+class TestChunkedMaze(unittest.TestCase):
+    # the chunks together form one perfect maze
+    def test_perfect(self):
+        for gen_func in [1, 2, 8]:
+            chunked = ChunkedMaze(4, 3, chunk_size=4, gen_func=gen_func, seed=gen_func)
+            maze = Maze(chunked.x, chunked.y)
+            maze.grid = chunked.grid[:, :].astype(int)
+            self.assertEqual(maze.grid.shape, (chunked.rows, chunked.cols))
+            self.assertEqual(maze.is_perfect(), True)
+
+    # chunks dropped from memory are generated again from the seed
+    def test_regenerate(self):
+        chunked = ChunkedMaze(3, 3, chunk_size=5, seed=7)
+        grid = chunked.window(0, chunked.rows, 0, chunked.cols)
+        small_cache = ChunkedMaze(3, 3, chunk_size=5, seed=7, cache_size=1)
+        for row in range(chunked.rows):
+            for col in range(chunked.cols):
+                self.assertEqual(small_cache.grid[row, col], grid[row, col])
+        self.assertEqual(len(small_cache._chunks), 1)
+        self.assertTrue(np.array_equal(small_cache.grid[4:17, 2:25], grid[4:17, 2:25]))
+        # outside the maze is wall
+        self.assertTrue(np.all(small_cache.window(-2, 0, 0, 5) == 1))
+
+    # nothing is generated up front, only the chunks that are looked at
+    def test_lazy(self):
+        chunked = ChunkedMaze(10 ** 6, 10 ** 6)
+        self.assertEqual(len(chunked._chunks), 0)
+        self.assertEqual(chunked.grid[chunked.end], 0)
+        self.assertEqual(len(chunked._chunks), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+import numpy as np
+from maze_game.maze_logic.maze_batch import generate_batch, maze_seed, pack_maze, unpack_maze
+from maze_game.maze_logic.maze import Maze
+
+
+class TestMazeBatch(unittest.TestCase):
+    """Test class for testing maze_batch.py"""
+    def test_pack_unpack(self):
+        maze = Maze(7, 4, 1)
+        unpacked = unpack_maze(pack_maze(maze), 7, 4)
+        self.assertTrue(np.array_equal(maze.grid, unpacked.grid))
+
+    # same seed gives the same mazes no matter the number of workers
+    def test_deterministic(self):
+        for gen_func in [1, 4, 7]:
+            mazes = generate_batch(6, 10, 8, gen_func, seed=42, workers=1)
+            self.assertEqual(len(mazes), 6)
+            for i, maze in enumerate(mazes):
+                self.assertEqual((maze.x, maze.y), (10, 8))
+                self.assertEqual(maze.is_perfect(), True)
+                # every maze knows how it was made and can be made again from its seed
+                self.assertEqual((maze.gen_func, maze.seed), (gen_func, maze_seed(42, i)))
+                self.assertTrue(np.array_equal(maze.grid, Maze(10, 8, gen_func, seed=maze.seed).grid))
+            for workers in [2, 3]:
+                other = generate_batch(6, 10, 8, gen_func, seed=42, workers=workers)
+                for maze, other_maze in zip(mazes, other):
+                    self.assertTrue(np.array_equal(maze.grid, other_maze.grid))
+            # another seed gives other mazes
+            other = generate_batch(6, 10, 8, gen_func, seed=43, workers=1)
+            self.assertFalse(all(np.array_equal(maze.grid, other_maze.grid) for maze, other_maze in zip(mazes, other)))
+
+
+if __name__ == '__main__':
+    unittest.main()
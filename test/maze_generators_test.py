@@ -1,50 +1,15 @@
 import unittest
+import random
 import numpy as np
-from maze_game.maze_logic.maze import Maze
-
-
-# helper function for testing maze generators
-def perfect_maze_check(maze):
-    """test if a maze object contains a perfect maze by a counting the number of open (0) cells
-    then use a flood fill heuristic
-    if the flood fill encounters cells that are already in the flood fill the maze contains loops != perfect
-    if after the flood fill the amount of flood filled cells is less then the amount of open cells (0) in the maze
-    the maze contains closed off areas != perfect
-    uses recursion because of this it's recommended to only test mazes upto 20x20 == 41*41 (wall and normal cells)
-    if any of the (implemented!) generation algorithms works upto 30x30 it can be suggested it will work with any size maze.
-    args:
-        maze: Maze object
-    returns:
-        True if Maze object is a perfect maze.
-        False if maze object is not a perfect maze."""
-    # count all open cells with for loop through the grid
-    open_cell_count = np.count_nonzero(maze.grid == 0)
-
-    def flood(flooded_cells=[], current_cell=(1, 1)):
-        if current_cell in flooded_cells:
-            return False
-        flooded_cells.append(current_cell)
-        open_cell_neighbors = [n for n in maze.neighbors(current_cell[0], current_cell[1], radius=1) if
-                               not maze.grid[n] and n not in flooded_cells]
-        if len(open_cell_neighbors) == 0:
-            return flooded_cells
-        for neighbor in open_cell_neighbors:
-            flooded_cells = flood(flooded_cells=flooded_cells, current_cell=neighbor)
-        return flooded_cells
-
-    flooded_cells = flood()
-    if not flooded_cells:
-        return False
-    elif len(flooded_cells) != open_cell_count or not flooded_cells:
-        return False
-    return True
+from maze_game.maze_logic.maze import Maze, gen_funcs, gen_steps
+from maze_game.maze_logic.maze_generators import GROWING_TREE_POLICIES, growing_tree, growing_tree_steps, INACTIVE
 
 
 class TestMazeGenerators(unittest.TestCase):
     """Test class for testing maze_generators.py
     by testing if the algorithms result in a perfect maze."""
-    # test perfect maze checker has to work to check if mazes are perfect
-    def test_perfect_maze_checker(self):
+    # test Maze.is_perfect has to work to check if mazes are perfect
+    def test_is_perfect(self):
         maze = Maze(3, 3)
         # valid maze
         maze.grid = np.array([[1, 1, 1, 1, 1, 1, 1],
@@ -54,7 +19,7 @@ class TestMazeGenerators(unittest.TestCase):
                               [1, 0, 1, 0, 1, 0, 1],
                               [1, 0, 1, 0, 0, 0, 1],
                               [1, 1, 1, 1, 1, 1, 1]])
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
         # invalid maze because top left corner there is a loop
         maze.grid = np.array([[1, 1, 1, 1, 1, 1, 1],
                               [1, 0, 0, 0, 1, 0, 1],
@@ -63,7 +28,7 @@ class TestMazeGenerators(unittest.TestCase):
                               [1, 0, 1, 0, 1, 0, 1],
                               [1, 0, 1, 0, 0, 0, 1],
                               [1, 1, 1, 1, 1, 1, 1]])
-        self.assertEqual(perfect_maze_check(maze), False)
+        self.assertEqual(maze.is_perfect(), False)
         # invalid maze because top right corner there a partition blocked off
         maze.grid = np.array([[1, 1, 1, 1, 1, 1, 1],
                               [1, 0, 1, 0, 1, 0, 1],
@@ -72,42 +37,148 @@ class TestMazeGenerators(unittest.TestCase):
                               [1, 0, 1, 0, 1, 0, 1],
                               [1, 0, 1, 0, 0, 0, 1],
                               [1, 1, 1, 1, 1, 1, 1]])
-        self.assertEqual(perfect_maze_check(maze), False)
+        self.assertEqual(maze.is_perfect(), False)
+        # invalid maze with a loop and a closed off partition, but one edge less than open positions
+        maze.grid = np.ones((7, 7))
+        maze.grid[1:3, 1:3] = 0
+        maze.grid[5, 5] = 0
+        self.assertEqual(maze.is_perfect(), False)
+        # large mazes
+        self.assertEqual(Maze(300, 200, 8).is_perfect(), True)
 
     # Depth first search
     def test_is_DFS_perfect(self):
         maze = Maze(3, 3, 1)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
         maze = Maze(20, 20, 1)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
 
     # Prim
     def test_is_Prim_perfect(self):
         maze = Maze(3, 3, 2)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
         maze = Maze(20, 20, 2)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
 
     # Wilson in combination with Aldolous Broder
     def test_is_WilsonAB_perfect(self):
         maze = Maze(3, 3, 3)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
         maze = Maze(20, 20, 3)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
+        # single row, single column and single cell mazes
+        for x, y in [(20, 1), (1, 20), (1, 1)]:
+            maze = Maze(x, y, 3)
+            self.assertEqual(maze.is_perfect(), True)
 
     # Wilson
     def test_is_Wilson_perfect(self):
         maze = Maze(3, 3, 4)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
         maze = Maze(20, 20, 4)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
+        # single row, single column and single cell mazes
+        for x, y in [(20, 1), (1, 20), (1, 1)]:
+            maze = Maze(x, y, 4)
+            self.assertEqual(maze.is_perfect(), True)
 
     # Aldolous Broder
     def test_is_AB_perfect(self):
         maze = Maze(3, 3, 5)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
         maze = Maze(20, 20, 5)
-        self.assertEqual(perfect_maze_check(maze), True)
+        self.assertEqual(maze.is_perfect(), True)
+
+    # Binary tree
+    def test_is_BinaryTree_perfect(self):
+        maze = Maze(3, 3, 6)
+        self.assertEqual(maze.is_perfect(), True)
+        maze = Maze(20, 20, 6)
+        self.assertEqual(maze.is_perfect(), True)
+
+    # Sidewinder
+    def test_is_Sidewinder_perfect(self):
+        maze = Maze(3, 3, 7)
+        self.assertEqual(maze.is_perfect(), True)
+        maze = Maze(20, 20, 7)
+        self.assertEqual(maze.is_perfect(), True)
+
+    # Eller
+    def test_is_Eller_perfect(self):
+        maze = Maze(3, 3, 8)
+        self.assertEqual(maze.is_perfect(), True)
+        maze = Maze(20, 20, 8)
+        self.assertEqual(maze.is_perfect(), True)
+        # single row and single column mazes
+        maze = Maze(20, 1, 8)
+        self.assertEqual(maze.is_perfect(), True)
+        maze = Maze(1, 20, 8)
+        self.assertEqual(maze.is_perfect(), True)
+
+    # Kruskal
+    def test_is_Kruskal_perfect(self):
+        maze = Maze(3, 3, 9)
+        self.assertEqual(maze.is_perfect(), True)
+        maze = Maze(20, 20, 9)
+        self.assertEqual(maze.is_perfect(), True)
+        # single row, single column and single cell mazes
+        for x, y in [(20, 1), (1, 20), (1, 1)]:
+            maze = Maze(x, y, 9)
+            self.assertEqual(maze.is_perfect(), True)
+
+    # Growing tree, every policy
+    def test_is_GrowingTree_perfect(self):
+        for policy in GROWING_TREE_POLICIES:
+            for x, y in [(3, 3), (20, 20), (20, 1), (1, 20), (1, 1)]:
+                maze = Maze(x, y)
+                growing_tree(maze, policy)
+                self.assertEqual(maze.is_perfect(), True)
+        # mixed always or never picking the newest cell
+        for split in (0, 1):
+            maze = Maze(20, 20)
+            growing_tree(maze, 'mixed', split)
+            self.assertEqual(maze.is_perfect(), True)
+        with self.assertRaises(ValueError):
+            growing_tree_steps(Maze(3, 3), 'biggest')
+
+    # the mixed policy keeps the active cells in order, so picking the newest cell always picks the last one added
+    def test_GrowingTree_mixed_order(self):
+        class RecordingRandom(random.Random):
+            """random number generator remembering the last value of random (the newest or random choice)"""
+            def random(self):
+                self.last = super().random()
+                return self.last
+
+            # keeps randrange from using random
+            def getrandbits(self, k):
+                return super().getrandbits(k)
+
+        maze = Maze(15, 15, rng=RecordingRandom(5))
+        steps = growing_tree_steps(maze, 'mixed', 0.5)
+        # active cells in the order they were added
+        active = [next(steps)[1][1]]
+        for step in steps:
+            newest = active[-1]
+            if step[0] == INACTIVE:
+                current = step[1]
+                active.remove(current)
+            else:
+                (_, wall), (_, next_pos), _ = step
+                current = (2 * wall[0] - next_pos[0], 2 * wall[1] - next_pos[1])
+                active.append(next_pos)
+            if maze.rng.last < 0.5:
+                self.assertEqual(current, newest)
+        self.assertEqual(active, [])
+        self.assertEqual(maze.is_perfect(), True)
+
+    # step generators carve out the same maze as the generation algorithms, one step at a time
+    def test_steps(self):
+        for gen_func in gen_funcs:
+            maze = Maze(8, 6, seed=gen_func)
+            steps = list(gen_steps[gen_func](maze))
+            self.assertTrue(len(steps) > 0)
+            self.assertTrue(np.array_equal(maze.grid, Maze(8, 6, gen_func, seed=gen_func).grid))
+            self.assertEqual(maze.is_perfect(), True)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,9 @@
 import unittest
-from maze_game.maze_logic.maze import Maze
+from maze_game.maze_logic.maze import Maze, gen_funcs, NORTH, EAST, SOUTH, WEST
+from maze_game.maze_logic.maze_solvers import breadth_first_search
+import os
 import random
+import tempfile
 import numpy as np
 
 
@@ -17,6 +20,33 @@ class TestMaze(unittest.TestCase):
         self.assertEqual(maze.rows, height * 2 + 1)
         self.assertEqual(maze.cols, width * 2 + 1)
 
+    # the same seed gives the same maze for every generation algorithm
+    def test_seed(self):
+        for gen_func in gen_funcs:
+            maze = Maze(12, 9, gen_func, seed=7)
+            self.assertTrue(np.array_equal(maze.grid, Maze(12, 9, gen_func, seed=7).grid))
+            self.assertTrue(np.array_equal(maze.grid, Maze(12, 9, gen_func, rng=random.Random(7)).grid))
+            self.assertFalse(np.array_equal(maze.grid, Maze(12, 9, gen_func, seed=8).grid))
+
+    # a saved maze loads back the same with and without memory mapping
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.maze')
+            for x, y in [(1, 1), (3, 5), (13, 7)]:
+                maze = Maze(x, y, 4, seed=1)
+                maze.save(path)
+                # 32 byte header + 2 bits per cell
+                self.assertEqual(os.path.getsize(path), 32 + (x * y + 3) // 4)
+                for mmap in [True, False]:
+                    loaded = Maze.load(path, mmap=mmap)
+                    self.assertEqual((loaded.x, loaded.y, loaded.start, loaded.end, loaded.gen_func),
+                                     (x, y, maze.start, maze.end, 4))
+                    # walls are read from the packed walls without creating the grid
+                    self.assertTrue(np.array_equal(loaded.walls, maze.walls))
+                    self.assertIsNone(loaded._grid)
+                    self.assertTrue(np.array_equal(loaded.grid, maze.grid))
+                    del loaded
+
     # test if adj list gets created and adjusted properly
     def test_adj_list(self):
         # maze full with 1's ( no edges ) so adj list representation should be empty
@@ -46,5 +76,135 @@ class TestMaze(unittest.TestCase):
         # (1,2) and (2,1) are only connected to (1,1)
         self.assertEqual(maze.adj_lst, {(1, 1): [(2, 1), (1, 2)], (1, 2): [(1, 1)], (2, 1): [(1, 1)]})
 
+    # test if the packed walls get created properly and are updated when the grid changes
+    def test_walls(self):
+        maze = Maze(3, 3)
+        self.assertTrue(np.all(maze.walls == NORTH | EAST | SOUTH | WEST))
+
+        maze.grid = np.array([[1, 1, 1, 1, 1, 1, 1],
+                              [1, 0, 0, 0, 1, 0, 1],
+                              [1, 0, 1, 1, 1, 0, 1],
+                              [1, 0, 1, 0, 0, 0, 1],
+                              [1, 1, 1, 1, 1, 1, 1],
+                              [1, 0, 1, 0, 1, 0, 1],
+                              [1, 1, 1, 1, 1, 1, 1]])
+        # (1,1) is connected to (1,3) and (3,1)
+        self.assertEqual(maze.walls[maze.cell_index(1, 1)], NORTH | WEST)
+        self.assertEqual(sorted(maze.connected_cells(0)), [1, 3])
+        self.assertEqual(maze.walls[maze.cell_index(3, 3)], NORTH | SOUTH | WEST)
+        self.assertEqual(maze.cells_to_path([3, 0, 1]), [(3, 1), (2, 1), (1, 1), (1, 2), (1, 3)])
+
+        # destroying a wall resets the cached walls
+        maze.destroy_wall((3, 1), (5, 1))
+        self.assertEqual(maze.walls[maze.cell_index(3, 1)], EAST | WEST)
+        self.assertEqual(maze.walls[maze.cell_index(5, 1)], EAST | SOUTH | WEST)
+        # writing to the grid directly also resets them
+        maze.grid[1, 2] = 1
+        self.assertEqual(maze.walls[0], NORTH | EAST | WEST)
+
+    # the distance field gives the same shortest paths as breadth first search
+    def test_distance_field(self):
+        maze = Maze(12, 9, 2, seed=4)
+        dist, next_cell = maze.distance_field
+        end = maze.cell_index(*maze.end)
+        self.assertEqual((dist[end], next_cell[end]), (0, end))
+        for start_pos in [maze.start, (5, 7), (4, 7), (7, 8), maze.end]:
+            path = breadth_first_search(maze, start_pos)
+            self.assertEqual(maze.path_to_end(start_pos), path)
+        self.assertEqual(2 * dist[0] + 1, len(maze.path_to_end(maze.start)))
+        # the field is computed again when the maze changes
+        maze.grid[maze.end[0] - 1, maze.end[1]] = 1
+        maze.grid[maze.end[0], maze.end[1] - 1] = 1
+        self.assertIsNone(maze.path_to_end(maze.start))
+
+    # the grid is stored with 1 byte per position, also when it is set from another array or loaded from packed walls
+    def test_grid_dtype(self):
+        maze = Maze(12, 9, 8, seed=3)
+        self.assertEqual(maze.grid.dtype, np.uint8)
+        other = Maze(12, 9)
+        other.grid = np.asarray(maze.grid).astype(int)
+        self.assertEqual(other.grid.dtype, np.uint8)
+        self.assertTrue(np.array_equal(other.grid, maze.grid))
+        self.assertEqual(maze.unpack_grid(maze.pack_walls()).dtype, np.uint8)
+        self.assertEqual(maze.unpack_walls(maze.pack_walls()).dtype, np.uint8)
+
+    # writes to views of the grid reset the cached walls, writes to copies of it don't
+    def test_grid_views(self):
+        maze = Maze(4, 3, 1, seed=2)
+        walls = maze.walls
+        # copies and results of operations on the grid have their own memory
+        copy, open_grid = maze.grid.copy(), maze.grid == 0
+        copy[1, 1] = 1
+        open_grid[1, 1] = False
+        self.assertIs(maze.walls, walls)
+        self.assertEqual(maze.grid[1, 1], 0)
+        # slices and views share it
+        maze.grid[1:4, 1:4][0, 1] = 1
+        self.assertEqual(maze.walls[0] & EAST, EAST)
+        maze.grid.T[2, 1] = 0
+        self.assertEqual(maze.walls[0] & EAST, 0)
+
+    # in place writes either reset the cached walls (fill) or are not allowed (in place operators, out=, copyto, flat)
+    def test_grid_in_place(self):
+        maze = Maze(4, 3, 1, seed=2)
+        walls = maze.walls
+        maze.grid[1:-1, 1:-1].fill(0)
+        self.assertEqual(maze.walls[0], NORTH | WEST)
+        self.assertIsNot(maze.walls, walls)
+        for write in [lambda grid: grid.__iadd__(1), lambda grid: np.add(grid, 1, out=grid),
+                      lambda grid: np.copyto(grid, 1), lambda grid: grid.flat.__setitem__(0, 0),
+                      lambda grid: np.asarray(grid).__setitem__(0, 0)]:
+            with self.assertRaises(ValueError):
+                write(maze.grid)
+            with self.assertRaises(ValueError):
+                write(maze.grid[1:3])
+        self.assertEqual(maze.walls[0], NORTH | WEST)
+        self.assertEqual(maze.grid[0, 0], 1)
+
+    # the distance map from one or more sources gives the shortest path lengths, also when stopping at the targets
+    def test_distances(self):
+        maze = Maze(12, 9, 4, seed=6)
+        distances = maze.distances(maze.end)
+        self.assertEqual(distances.shape, maze.grid.shape)
+        self.assertTrue(np.all((distances == -1) == (maze.grid == 1)))
+        # distance in grid steps is the length of the shortest path to the end - 1 (from cells and passages)
+        targets = [tuple(position) for position in np.argwhere(maze.grid == 0)[::7]]
+        for target in targets:
+            self.assertEqual(distances[target], len(breadth_first_search(maze, target)) - 1)
+        # stopping at the targets gives the same distances for them
+        early = maze.distances(maze.end, targets[:3])
+        for target in targets[:3]:
+            self.assertEqual(early[target], distances[target])
+        # multiple sources give the distance to the nearest source, sources on a passage work as well
+        from_start = maze.distances(maze.start)
+        self.assertTrue(np.array_equal(maze.distances([maze.start, maze.end]), np.minimum(distances, from_start)))
+        passage = tuple(np.argwhere(maze.grid[1::2, 2:-1:2] == 0)[0] * 2 + (1, 2))
+        from_passage = maze.distances(passage)
+        self.assertEqual(from_passage[passage], 0)
+        self.assertEqual((from_passage[passage[0], passage[1] - 1], from_passage[passage[0], passage[1] + 1]), (1, 1))
+        with self.assertRaises(ValueError):
+            maze.distances((0, 0))
+
+    # cached solutions give the same paths as breadth first search and are reused from any position on them
+    def test_solution(self):
+        maze = Maze(12, 9, 1, seed=8)
+        path = maze.solution(maze.start)
+        self.assertEqual(path, breadth_first_search(maze, maze.start))
+        # starts on the cached path (cells and passages) use the rest of it without searching
+        for start_pos in path[1::3]:
+            self.assertEqual(maze.solution(start_pos), breadth_first_search(maze, start_pos))
+        self.assertEqual(len(maze._solutions), 1)
+        # other starts get searched and cached, the least recently used solutions are dropped
+        maze.solution_cache_size = 2
+        starts = [tuple(position) for position in np.argwhere(maze.grid == 0)[::9]]
+        for start_pos in starts:
+            self.assertEqual(maze.solution(start_pos, breadth_first_search), breadth_first_search(maze, start_pos))
+        self.assertTrue(len(maze._solutions) <= 2)
+        # the cache is cleared when the grid changes
+        maze.grid[maze.end[0] - 1, maze.end[1]] = 1
+        maze.grid[maze.end[0], maze.end[1] - 1] = 1
+        self.assertIsNone(maze.solution(maze.start))
+
+
 if __name__ == '__main__':
     unittest.main()
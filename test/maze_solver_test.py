@@ -42,6 +42,56 @@ class TestMazeSolvers(unittest.TestCase):
         # shortest path will always be:
         self.assertEqual(path, [(1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (5, 2), (5, 3), (5, 4), (5, 5)])
 
+    # A* and bidirectional search find the same shortest paths as breadth first search
+    def test_A_star_bidirectional(self):
+        maze = Maze(3, 3)
+        maze.grid = np.array([[1, 1, 1, 1, 1, 1, 1],
+                              [1, 0, 1, 0, 0, 0, 1],
+                              [1, 0, 1, 0, 0, 0, 1],
+                              [1, 0, 1, 0, 0, 0, 1],
+                              [1, 0, 1, 0, 1, 0, 1],
+                              [1, 0, 0, 0, 0, 0, 1],
+                              [1, 1, 1, 1, 1, 1, 1]])
+        for solver in [a_star, bidirectional_search]:
+            stats = dict()
+            path = solver(maze, (1, 1), stats=stats)
+            self.assertEqual(path, [(1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (5, 2), (5, 3), (5, 4), (5, 5)])
+            self.assertTrue(0 < stats['expanded'] <= 9)
+            # start in the passage between 2 cells
+            path = solver(maze, (5, 2))
+            self.assertEqual(path, [(5, 2), (5, 3), (5, 4), (5, 5)])
+
+        maze = Maze(20, 20, 1)
+        for name in solvers:
+            self.assertEqual(solvers[name](maze, maze.start), breadth_first_search(maze, maze.start))
+
+    # searches from a passage start from both cells next to it, also in mazes with loops
+    def test_passage_start(self):
+        maze = Maze(3, 3)
+        maze.grid = np.array([[1, 1, 1, 1, 1, 1, 1],
+                              [1, 0, 0, 0, 0, 0, 1],
+                              [1, 0, 1, 1, 1, 0, 1],
+                              [1, 0, 1, 0, 1, 0, 1],
+                              [1, 0, 1, 1, 1, 0, 1],
+                              [1, 0, 0, 0, 0, 0, 1],
+                              [1, 1, 1, 1, 1, 1, 1]])
+        # the shortest path goes down through (3, 1), not up through (1, 1)
+        for solver in (breadth_first_search, a_star, bidirectional_search):
+            path = solver(maze, (2, 1))
+            self.assertEqual(path, [(2, 1), (3, 1), (4, 1), (5, 1), (5, 2), (5, 3), (5, 4), (5, 5)])
+        self.assertEqual(maze.path_to_end((2, 1)), path)
+        self.assertEqual(maze.solution((2, 1)), path)
+        self.assertEqual(maze.distances((2, 1))[maze.end], len(path) - 1)
+
+    # step generators yield the visited cells and return the path
+    def test_steps(self):
+        maze = Maze(10, 10, 1, seed=1)
+        for steps in [breadth_first_search_steps, depth_first_search_steps, a_star_steps, bidirectional_search_steps]:
+            self.assertEqual(run_steps(steps(maze, maze.start), maze), breadth_first_search(maze, maze.start))
+        events = list(breadth_first_search_steps(maze, maze.start))
+        self.assertEqual(events[0], (VISIT, maze.cell_index(*maze.start)))
+        self.assertTrue(all(event == PATH for event, position in events[-1]))
+
 
 
 if __name__ == '__main__':
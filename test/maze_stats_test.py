@@ -0,0 +1,42 @@
+import unittest
+from maze_game.maze_logic.maze import Maze
+from maze_game.maze_logic.maze_stats import maze_stats, batch_stats
+from maze_game.maze_logic.maze_solvers import breadth_first_search
+
+
+# test class to test the statistics of mazes
+class TestMazeStats(unittest.TestCase):
+    def test_stats(self):
+        maze = Maze(3, 3)
+        # corridor along the top row and down the left and right column, with branches to the center and (5, 3)
+        maze.grid[1, 1:-1] = 0
+        maze.grid[1:-1, 5] = 0
+        maze.grid[1:-1, 1] = 0
+        maze.grid[3, 2:4] = 0
+        maze.grid[5, 3:5] = 0
+        stats = maze_stats(maze)
+        # dead ends: (5, 1), (5, 3) and the center cell, junction: (3, 1)
+        self.assertEqual(stats['dead_ends'], 3)
+        self.assertEqual(stats['junctions'], 1)
+        self.assertEqual(stats['solution_length'], 4)
+        # longest path: from (5, 1) to (5, 3)
+        self.assertEqual(stats['diameter'], 7)
+        self.assertEqual(stats['river_factor'], 5 / 9)
+        self.assertEqual(stats['branching_factor'], 7 / 6)
+
+    # the solution length and diameter match breadth first search, batches match single mazes
+    def test_batch(self):
+        mazes = [Maze(12, 8, gen_func, seed=gen_func) for gen_func in [1, 2, 4, 8]] + [Maze(5, 5, 1, seed=1)]
+        stats = batch_stats(mazes)
+        for i, maze in enumerate(mazes):
+            self.assertEqual(len(breadth_first_search(maze, maze.start)) // 2, stats['solution_length'][i])
+            for name, value in maze_stats(maze).items():
+                self.assertAlmostEqual(stats[name][i], value)
+            # the diameter is the longest distance between any 2 cells
+            cells = maze.x * maze.y
+            longest = max(maze.tree.distance(a, b) for a in range(cells) for b in range(a))
+            self.assertEqual(stats['diameter'][i], longest)
+
+
+if __name__ == '__main__':
+    unittest.main()
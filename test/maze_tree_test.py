@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from maze_game.maze_logic.maze import Maze
+from maze_game.maze_logic.maze_solvers import breadth_first_search
+
+
+# test class to test path and distance queries on the tree index of a maze
+class TestMazeTree(unittest.TestCase):
+    # the paths and distances between cells are the shortest paths found by breadth first search
+    def test_path_distance(self):
+        for gen_func in [1, 2, 4]:
+            maze = Maze(9, 7, gen_func, seed=gen_func)
+            rng = np.random.default_rng(gen_func)
+            for a, b in rng.integers(0, maze.x * maze.y, (20, 2)).tolist():
+                maze.end = maze.cell_position(b)
+                path = breadth_first_search(maze, maze.cell_position(a))
+                maze.end = (maze.rows - 2, maze.cols - 2)
+                self.assertEqual(maze.tree.path(maze.cell_position(a), maze.cell_position(b)), path)
+                self.assertEqual(maze.tree.distance(a, b), len(path) // 2)
+                self.assertEqual(maze.tree.distance(b, a), len(path) // 2)
+        self.assertEqual(maze.tree.lca(0, maze.cell_index(*maze.end)), maze.cell_index(*maze.end))
+
+    # batch queries give the same answers as single queries
+    def test_batch(self):
+        maze = Maze(15, 10, 3, seed=1)
+        rng = np.random.default_rng(0)
+        a, b = rng.integers(0, maze.x * maze.y, 500), rng.integers(0, maze.x * maze.y, 500)
+        distances = maze.tree.distance(a, b)
+        lcas = maze.tree.lca(a, b)
+        self.assertEqual(distances.shape, (500,))
+        for i in range(500):
+            self.assertEqual(distances[i], maze.tree.distance(int(a[i]), int(b[i])))
+            self.assertEqual(lcas[i], maze.tree.lca(int(a[i]), int(b[i])))
+        self.assertTrue(np.all(maze.tree.distance(a, a) == 0))
+
+    # cells that aren't connected to the end have no path
+    def test_not_connected(self):
+        maze = Maze(3, 3)
+        # only the right column is connected to the end
+        maze.grid[1, 1:4] = 0
+        maze.grid[1:-1, 5] = 0
+        self.assertEqual(maze.tree.distance(0, 2), -1)
+        self.assertEqual(maze.tree.distance(0, 1), -1)
+        self.assertIsNone(maze.tree.path((1, 1), (1, 5)))
+        self.assertEqual(maze.tree.distance(2, 8), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""script to compare the solving time of breadth first search with the list based version it replaced
+    on open mazes (no inner walls) where the queue/frontier of the search gets as large as possible.
+    the list based version is quadratic so it is only timed up to legacy_max_size."""
+from maze_game.maze_logic.maze import Maze
+from maze_game.maze_logic.maze_solvers import breadth_first_search
+import time
+import matplotlib.pyplot as plt
+
+sizes = [500, 2000]
+# the list based bfs takes hours on a 2000x2000 maze
+legacy_max_size = 500
+
+
+def list_queue_bfs(maze, start_pos):
+    """the replaced breadth first search: list as queue (O(n) dequeue), distance dict and min() path reconstruction"""
+    start = maze.cell_index(*start_pos)
+    end = maze.cell_index(*maze.end)
+    dist_from_start = {index: float('inf') for index in range(maze.x * maze.y)}
+    queue = [start]
+    dist_from_start[start] = 0
+    while queue:
+        current = queue[0]
+        queue.remove(current)
+        for connected_cell in maze.connected_cells(current):
+            if dist_from_start[connected_cell] == float('inf'):
+                dist_from_start[connected_cell] = dist_from_start[current] + 1
+                queue.append(connected_cell)
+                if connected_cell == end:
+                    queue = []
+                    break
+    current = end
+    cells = [current]
+    for i in range(dist_from_start[end]):
+        connected_cells = {index: dist_from_start[index] for index in maze.connected_cells(current)}
+        current = min(connected_cells, key=connected_cells.get)
+        cells.append(current)
+    cells.reverse()
+    return maze.cells_to_path(cells, start_pos)
+
+
+results_new = dict()
+results_legacy = dict()
+for size in sizes:
+    maze = Maze(size, size)
+    # open maze: every cell and wall inside the outer wall is carved out
+    maze.grid[1:-1, 1:-1] = 0
+    # build the packed walls up front (cached on the maze) so both solvers are timed on the search only
+    maze.walls
+
+    start = time.time()
+    path = breadth_first_search(maze, maze.start)
+    results_new[f'{size}x{size}'] = time.time() - start
+    print(f'{size}x{size} breadth first search: {results_new[f"{size}x{size}"]:.2f}s path length {len(path)}')
+
+    if size <= legacy_max_size:
+        start = time.time()
+        legacy_path = list_queue_bfs(maze, maze.start)
+        results_legacy[f'{size}x{size}'] = time.time() - start
+        print(f'{size}x{size} list queue search: {results_legacy[f"{size}x{size}"]:.2f}s path length {len(legacy_path)}')
+    else:
+        print(f'{size}x{size} list queue search: skipped (quadratic)')
+
+bar_width = 0.4
+bar_new = [i for i in range(len(sizes))]
+bar_legacy = [i + bar_width for i in range(len(sizes))]
+plt.bar(bar_new, results_new.values(), bar_width, label='BFS (deque + parent list)')
+plt.bar(bar_legacy[:len(results_legacy)], results_legacy.values(), bar_width, label='BFS (list queue)')
+plt.title('open maze solving')
+plt.xlabel('Maze size')
+plt.ylabel('Solve time in seconds')
+plt.xticks([i + bar_width / 2 for i in bar_new], results_new.keys())
+plt.legend()
+plt.show()
@@ -6,7 +6,8 @@ import matplotlib.pyplot as plt
 rounds = 1000
 maze_size = 50
 # for readability in plot
-alg_names = {1: 'Depth first search', 2: 'Prim', 3: 'Wilson & Aldolous Broder', 4: 'Wilson', 5: 'Aldolous Broder'}
+alg_names = {1: 'Depth first search', 2: 'Prim', 3: 'Wilson & Aldolous Broder', 4: 'Wilson', 5: 'Aldolous Broder',
+             6: 'Binary tree', 7: 'Sidewinder', 8: 'Eller', 9: 'Kruskal'}
 
 for size in range(10, 51, 20):
     results_gens = dict()
@@ -1,43 +1,46 @@
 """script to analyze the solving time of the different solving algorithms and plots the average solving time
-    tests every solver algorithm with every generator algorithm (excluding generator algorithms not used in the game)"""
+    tests every solver algorithm with every generator algorithm (excluding generator algorithms not used in the game)
+    also prints the average number of cells each solver expanded"""
 from maze_game.maze_logic.maze import Maze
 import time
-from maze_game.maze_logic.maze_solvers import depth_first_search, breadth_first_search
+from maze_game.maze_logic.maze_solvers import solvers
 import matplotlib.pyplot as plt
 rounds = 1000
 # for readability in plot (only test with implemented Generate algorithms IN the game)
 alg_names = {1:'Depth first search', 2:'Prim', 3:'Wilson & Aldolous Broder'}
-results = dict()
-bar_width = 0.4
+solver_names = {'bfs': 'BFS', 'dfs': 'DFS', 'a_star': 'A*', 'bidirectional': 'Bidirectional BFS'}
+bar_width = 0.2
 for size in range(10,51,20):
-    results_dfs = dict()
-    results_bfs = dict()
+    # {solver: {generator: average solve time}} and {solver: {generator: average nr of expanded cells}}
+    results_time = {solver: dict() for solver in solver_names}
+    results_expanded = {solver: dict() for solver in solver_names}
     for gen_func in alg_names:
-        bfs = []
-        dfs = []
+        times = {solver: [] for solver in solver_names}
+        expanded = {solver: [] for solver in solver_names}
         for i in range(rounds):
             maze = Maze(size, size, gen_func)
 
-            start = time.time()
-            breadth_first_search(maze, maze.start)
-            bfs.append(time.time() - start)
+            for solver in solver_names:
+                stats = dict()
+                start = time.time()
+                solvers[solver](maze, maze.start, stats=stats)
+                times[solver].append(time.time() - start)
+                expanded[solver].append(stats['expanded'])
 
-            start = time.time()
-            depth_first_search(maze, maze.start)
-            dfs.append(time.time() - start)
+        for solver in solver_names:
+            results_time[solver][alg_names[gen_func]] = sum(times[solver]) / len(times[solver])
+            results_expanded[solver][alg_names[gen_func]] = sum(expanded[solver]) / len(expanded[solver])
 
-        results_bfs[alg_names[gen_func]] = sum(bfs) / len(bfs)
-        results_dfs[alg_names[gen_func]] = sum(dfs) / len(dfs)
+    for solver in solver_names:
+        print(f'{size}x{size} {solver_names[solver]} average expanded cells: {results_expanded[solver]}')
 
-    bar_bfs = [i for i in range(len(results_bfs))]
-    bar_dfs = [i+bar_width for i in range(len(results_dfs))]
-
-    plt.bar(bar_bfs, results_bfs.values(), bar_width, label='BFS')
-    plt.bar(bar_dfs, results_dfs.values(), bar_width, label='DFS')
+    for i, solver in enumerate(solver_names):
+        bars = [j + i * bar_width for j in range(len(alg_names))]
+        plt.bar(bars, results_time[solver].values(), bar_width, label=solver_names[solver])
     plt.title(f'{size}x{size} maze solving')
     plt.xlabel('Maze generated by')
     plt.ylabel(f'Average solve time in seconds over {rounds} rounds')
-    plt.xticks(bar_bfs+bar_width/2, alg_names.values())
+    plt.xticks([j + bar_width * (len(solver_names) - 1) / 2 for j in range(len(alg_names))], alg_names.values())
 
     plt.xticks(size=8)
     plt.yticks(size=8)